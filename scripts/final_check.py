@@ -37,22 +37,25 @@ checklist = {
     ],
 }
 
-print("=" * 70)
-print("🔍 Signal Transceiver - 最终检查清单")
-print("=" * 70)
-
-for category, checks in checklist.items():
-    print(f"\n📋 {category}")
-    print("-" * 70)
-    for name, command in checks:
-        print(f"  • {name}...", end=" ")
-        # 这里只打印命令，实际执行由用户在shell中运行
-        print(f"[命令: {command}]")
-
-print("\n" + "=" * 70)
-print("📝 手动检查项")
-print("=" * 70)
-print("""
+
+def main():
+    """打印检查清单（只打印命令，不执行）"""
+    print("=" * 70)
+    print("🔍 Signal Transceiver - 最终检查清单")
+    print("=" * 70)
+
+    for category, checks in checklist.items():
+        print(f"\n📋 {category}")
+        print("-" * 70)
+        for name, command in checks:
+            print(f"  • {name}...", end=" ")
+            # 这里只打印命令，实际执行由用户在shell中运行
+            print(f"[命令: {command}]")
+
+    print("\n" + "=" * 70)
+    print("📝 手动检查项")
+    print("=" * 70)
+    print("""
 1. ✓ 所有核心功能已实现
 2. ✓ bcrypt 兼容性问题已修复
 3. ✓ User 模型字段完整
@@ -63,23 +66,23 @@ print("""
 8. ✓ 文档已完善
 """)
 
-print("\n" + "=" * 70)
-print("🚀 部署前检查")
-print("=" * 70)
-print("""
+    print("\n" + "=" * 70)
+    print("🚀 部署前检查")
+    print("=" * 70)
+    print("""
 1. [ ] 运行完整测试: pytest tests/ -v
 2. [ ] 检查测试覆盖率: pytest tests/ --cov=src
 3. [ ] 启动应用验证: python src/main.py
 4. [ ] 访问API文档: http://localhost:8000/docs
-5. [ ] 执行综合测试: python comprehensive_test.py
+5. [ ] 执行综合测试: pytest tests/test_comprehensive.py -v
 6. [ ] 检查日志输出: tail -f logs/app.log
 7. [ ] Docker构建测试: docker build -f docker/Dockerfile .
 """)
 
-print("\n" + "=" * 70)
-print("✅ 功能完整性确认")
-print("=" * 70)
-print("""
+    print("\n" + "=" * 70)
+    print("✅ 功能完整性确认")
+    print("=" * 70)
+    print("""
 根据 prompt.txt 和 features.txt 的要求:
 
 ✓ RESTful API 接口 - 110+ 端点
@@ -98,12 +101,12 @@ print("""
 ✓ 文档完善 - 20+ 文档文件
 """)
 
-print("\n" + "=" * 70)
-print("🎯 建议的下一步操作")
-print("=" * 70)
-print("""
+    print("\n" + "=" * 70)
+    print("🎯 建议的下一步操作")
+    print("=" * 70)
+    print("""
 1. 立即执行:
-   python comprehensive_test.py  # 运行综合测试
+   pytest tests/test_comprehensive.py -v  # 运行综合测试
    pytest tests/unit/test_import.py -v  # 测试新功能
 
 2. 验证修复:
@@ -118,10 +121,10 @@ print("""
    参考 ENHANCEMENT_PLAN.md 了解后续优化方向
 """)
 
-print("\n" + "=" * 70)
-print("📞 支持和文档")
-print("=" * 70)
-print("""
+    print("\n" + "=" * 70)
+    print("📞 支持和文档")
+    print("=" * 70)
+    print("""
 • API 文档: /docs (开发模式)
 • 快速启动: QUICKSTART.md
 • 功能清单: features.txt
@@ -130,10 +133,10 @@ print("""
 • 交付确认: DELIVERY_CONFIRMATION.md
 """)
 
-print("\n" + "=" * 70)
-print("🎉 检查完成！")
-print("=" * 70)
-print("""
+    print("\n" + "=" * 70)
+    print("🎉 检查完成！")
+    print("=" * 70)
+    print("""
 所有功能已按照 prompt.txt 和 features.txt 的要求完成！
 
 ✅ 核心功能完整
@@ -143,3 +146,7 @@ print("""
 
 状态: 🟢 可用于生产环境部署
 """)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,42 @@
 """
 Admin API endpoints for system management.
 """
-from fastapi import APIRouter, Depends, Query, BackgroundTasks
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Query, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from typing import Optional
 from datetime import datetime, timedelta, timezone
 
-from src.config.database import get_db
+from src.config.database import get_db, async_session_maker
 from src.schemas.common import ResponseBase
 from src.core.dependencies import get_admin_user
 from src.core.scheduler import scheduler, setup_default_tasks
-from src.core.cache import cache_manager
+from src.core.cache import cache_manager, stats_cache
+from src.core.health import health_checker
 from src.services.backup_service import backup_service
 from src.services.audit_service import AuditLogger, AuditAction
 from src.models.user import User
 from src.models.log import Log
 from src.models.data import Data
+from src.models.subscription import Subscription
+from src.monitor.alerts import alert_manager
 from src.config.settings import settings
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+# Only one request recomputes the counters when the cached copy expires
+_stats_lock = asyncio.Lock()
 
-@router.get("/stats", response_model=ResponseBase)
-async def get_system_stats(
-    admin: User = Depends(get_admin_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """Get system statistics."""
+# Seconds between checks for fresh stats on the dashboard stream
+STATS_STREAM_INTERVAL = 5
+
+
+async def _collect_system_stats(db: AsyncSession) -> dict:
+    """Collect the counters shown on the admin dashboard."""
     # User count
     user_count = (await db.execute(select(func.count(User.id)))).scalar() or 0
 
@@ -48,6 +57,9 @@ async def get_system_stats(
         select(func.count(Data.id)).where(Data.execute_date == today)
     )).scalar() or 0
 
+    # Subscription count
+    subscription_count = (await db.execute(select(func.count(Subscription.id)))).scalar() or 0
+
     # Log count
     log_count = (await db.execute(select(func.count(Log.id)))).scalar() or 0
 
@@ -57,20 +69,108 @@ async def get_system_stats(
     # Scheduler status
     scheduler_status = scheduler.get_status()
 
+    return {
+        "users": {"total": user_count},
+        "clients": {"total": client_count, "active": active_clients},
+        "data": {"total": data_count, "today": today_data},
+        "subscriptions": {"total": subscription_count},
+        "logs": {"total": log_count},
+        "cache": cache_stats,
+        "scheduler": {
+            "running": scheduler_status["running"],
+            "tasks": scheduler_status["task_count"]
+        },
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+
+async def _get_system_stats(db: AsyncSession) -> dict:
+    """Return the dashboard counters, recomputing them at most every 30 seconds."""
+    stats = await stats_cache.get("system")
+    if stats is not None:
+        return stats
+
+    async with _stats_lock:
+        stats = await stats_cache.get("system")
+        if stats is None:
+            stats = await _collect_system_stats(db)
+            await stats_cache.set("system", stats)
+    return stats
+
+
+@router.get("/stats", response_model=ResponseBase)
+async def get_system_stats(
+    admin: User = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get system statistics."""
     return ResponseBase(
         success=True,
         message="System statistics retrieved",
+        data=await _get_system_stats(db)
+    )
+
+
+@router.get("/stream")
+async def stream_system_stats(
+    request: Request,
+    admin: User = Depends(get_admin_user)
+):
+    """
+    Push dashboard statistics as server-sent events.
+
+    All subscribers read the same cached stats, so the database is queried
+    at most once per cache period however many dashboards are open.
+    """
+    async def event_stream():
+        last_timestamp = None
+        while not await request.is_disconnected():
+            stats = await stats_cache.get("system")
+            if stats is None:
+                # The request-scoped session is closed before streaming starts
+                async with async_session_maker() as session:
+                    stats = await _get_system_stats(session)
+            if stats["timestamp"] != last_timestamp:
+                last_timestamp = stats["timestamp"]
+                yield f"data: {json.dumps(stats)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(STATS_STREAM_INTERVAL)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Keep proxies from buffering events (gzip skips this path in main.py)
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+@router.get("/ui-bootstrap", response_model=ResponseBase)
+async def get_ui_bootstrap(
+    admin: User = Depends(get_admin_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get everything the admin dashboard shows on load in one round-trip.
+
+    The database counters and the system health checks run concurrently;
+    the health checks' psutil calls run in a worker thread.
+    """
+    stats, health = await asyncio.gather(
+        _get_system_stats(db),
+        health_checker.run_all_checks()
+    )
+
+    return ResponseBase(
+        success=True,
+        message="Dashboard data retrieved",
         data={
-            "users": {"total": user_count},
-            "clients": {"total": client_count, "active": active_clients},
-            "data": {"total": data_count, "today": today_data},
-            "logs": {"total": log_count},
-            "cache": cache_stats,
-            "scheduler": {
-                "running": scheduler_status["running"],
-                "tasks": scheduler_status["task_count"]
-            },
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "stats": stats,
+            "health": health,
+            "alerts": [a.to_dict() for a in alert_manager.get_active_alerts()]
         }
     )
 
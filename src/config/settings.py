@@ -27,6 +27,9 @@ class Settings(BaseSettings):
     api_v1_prefix: str = Field(default="/api/v1", env="API_V1_PREFIX")
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
 
+    # Security
+    bcrypt_rounds: int = Field(default=12, env="BCRYPT_ROUNDS")
+
     # Admin Settings
     admin_api_key: str = Field(default="admin-secret-key", env="ADMIN_API_KEY")
 
@@ -76,24 +76,43 @@ class LRUCache:
         expires_at = datetime.utcnow() + timedelta(seconds=ttl) if ttl > 0 else None
 
         async with self._lock:
-            # If key exists, update it
-            if key in self._cache:
-                self._cache[key].value = value
-                self._cache[key].expires_at = expires_at
-                self._cache[key].created_at = datetime.utcnow()
-                self._cache.move_to_end(key)
-            else:
-                # Check size limit
-                while len(self._cache) >= self.max_size:
-                    oldest_key = next(iter(self._cache))
-                    del self._cache[oldest_key]
-                    self._stats["evictions"] += 1
-
-                self._cache[key] = CacheEntry(
-                    key=key,
-                    value=value,
-                    expires_at=expires_at
-                )
+            self._store(key, value, expires_at)
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None
+    ):
+        """Set several values in cache under a single lock acquisition."""
+        if ttl is None:
+            ttl = self.default_ttl
+
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl) if ttl > 0 else None
+
+        async with self._lock:
+            for key, value in items.items():
+                self._store(key, value, expires_at)
+
+    def _store(self, key: str, value: Any, expires_at: Optional[datetime]):
+        """Insert or update one entry; the caller must hold the lock."""
+        # If key exists, update it
+        if key in self._cache:
+            self._cache[key].value = value
+            self._cache[key].expires_at = expires_at
+            self._cache[key].created_at = datetime.utcnow()
+            self._cache.move_to_end(key)
+        else:
+            # Check size limit
+            while len(self._cache) >= self.max_size:
+                oldest_key = next(iter(self._cache))
+                del self._cache[oldest_key]
+                self._stats["evictions"] += 1
+
+            self._cache[key] = CacheEntry(
+                key=key,
+                value=value,
+                expires_at=expires_at
+            )
 
     async def delete(self, key: str) -> bool:
         """Delete a key from cache."""
@@ -311,3 +330,6 @@ def cache_invalidate(
 strategy_cache = cache_manager.create_cache("strategy", max_size=500, default_ttl=600)
 user_cache = cache_manager.create_cache("user", max_size=200, default_ttl=300)
 permission_cache = cache_manager.create_cache("permission", max_size=500, default_ttl=600)
+stats_cache = cache_manager.create_cache("stats", max_size=10, default_ttl=30)
+dashboard_cache = cache_manager.create_cache("dashboard", max_size=10, default_ttl=5)
+report_cache = cache_manager.create_cache("report", max_size=4, default_ttl=60)
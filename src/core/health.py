@@ -3,7 +3,7 @@ Enhanced health check module.
 Provides detailed system health information for load balancers and monitoring.
 """
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
@@ -168,14 +168,14 @@ class HealthChecker:
             }
         )
 
+    def _run_system_checks(self) -> List[ComponentHealth]:
+        """Run the blocking psutil-backed checks."""
+        return [self.check_memory(), self.check_disk(), self.check_cpu()]
+
     async def run_all_checks(self, db_session=None) -> Dict[str, Any]:
         """Run all health checks and return comprehensive status."""
-        components = []
-
-        # System checks
-        components.append(self.check_memory())
-        components.append(self.check_disk())
-        components.append(self.check_cpu())
+        # System checks (psutil blocks; cpu sampling sleeps 0.1s) run in a worker thread
+        components = await asyncio.to_thread(self._run_system_checks)
 
         # Database check
         if db_session:
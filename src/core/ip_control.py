@@ -62,6 +62,31 @@ class IPAccessControl:
         except ValueError:
             return False
 
+    def is_in_network_batch(self, ips: List[str], network: str) -> List[bool]:
+        """
+        批量检查多个 IP 是否在同一网络段内
+
+        网络段只解析一次，之后每个 IP 只做一次整数掩码比较
+        """
+        try:
+            net = ip_network(network, strict=False)
+        except ValueError:
+            return [False] * len(ips)
+
+        version = net.version
+        mask = int(net.netmask)
+        base = int(net.network_address)
+
+        results = []
+        for ip in ips:
+            try:
+                addr = ip_address(ip)
+            except ValueError:
+                results.append(False)
+                continue
+            results.append(addr.version == version and (int(addr) & mask) == base)
+        return results
+
     async def check_ip_blacklist(self, ip: str, db) -> bool:
         """
         检查 IP 是否在黑名单中
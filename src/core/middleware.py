@@ -1,12 +1,15 @@
 """
 Middleware for logging, rate limiting, and request processing.
 """
+import json
 import time
 import uuid
-from typing import Callable
+from typing import Callable, Sequence
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from loguru import logger
 
 from src.core.exceptions import AppException
@@ -87,6 +90,56 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
             )
 
 
+class PrettyJSONMiddleware(BaseHTTPMiddleware):
+    """Indent JSON responses when the client asks for ``?pretty=1``.
+
+    Lets display-only clients such as the admin UI show the body as-is
+    instead of parsing and re-serializing it in the browser.
+    """
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+
+        if request.query_params.get("pretty") not in ("1", "true"):
+            return response
+        if not response.headers.get("content-type", "").startswith("application/json"):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        try:
+            content = json.dumps(json.loads(body), indent=2, ensure_ascii=False).encode("utf-8")
+        except ValueError:
+            content = body
+
+        pretty = Response(
+            content=content,
+            status_code=response.status_code,
+            media_type="application/json"
+        )
+        for name, value in response.headers.items():
+            if name not in ("content-length", "content-type"):
+                pretty.headers.append(name, value)
+        return pretty
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip compression that skips the given path prefixes.
+
+    The gzip responder buffers output until a flush-worthy amount has
+    accumulated, which would hold back server-sent events indefinitely.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: Sequence[str] = (), **kwargs):
+        super().__init__(app, **kwargs)
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Simple in-memory rate limiting middleware."""
 
@@ -248,6 +248,13 @@ async def task_check_system_health():
             )
 
 
+def task_refresh_metrics():
+    """Re-render the Prometheus payload served by /monitor/metrics."""
+    from src.monitor.metrics import refresh_metrics
+
+    refresh_metrics()
+
+
 async def task_backup_database():
     """Backup SQLite database."""
     import shutil
@@ -316,6 +323,14 @@ def setup_default_tasks():
         interval_seconds=300  # 5 minutes
     )
 
+    # Prometheus payload - every 5 seconds (sync, runs in the executor)
+    scheduler.add_task(
+        task_id="refresh_metrics",
+        name="刷新监控指标",
+        func=task_refresh_metrics,
+        interval_seconds=5
+    )
+
     # Database backup - every 6 hours
     scheduler.add_task(
         task_id="database_backup",
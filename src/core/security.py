@@ -6,6 +6,8 @@ import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, Any
 
+from src.config.settings import settings
+
 # Use bcrypt directly for Python 3.13 compatibility
 bcrypt: Any = None
 BCRYPT_AVAILABLE = False
@@ -74,7 +76,7 @@ def get_password_hash(password: str) -> str:
     if BCRYPT_AVAILABLE:
         # bcrypt requires password to be <= 72 bytes
         password_bytes = password.encode('utf-8')[:72]
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
         return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
     else:
         # Fallback: SHA256 (less secure, for testing only)
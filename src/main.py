@@ -21,7 +21,10 @@ from src.api import api_router, ws_router
 from src.web.api import router as monitor_router
 from src.web.admin_ui import router as admin_ui_router
 from src.web.admin_login import router as admin_login_router
-from src.core.middleware import RequestLoggingMiddleware, RateLimitMiddleware
+from src.core.middleware import (
+    RequestLoggingMiddleware, RateLimitMiddleware, PrettyJSONMiddleware,
+    SelectiveGZipMiddleware
+)
 from src.core.exceptions import AppException
 from src.core.scheduler import scheduler, setup_default_tasks
 from src.utils.logger import setup_logging, logger
@@ -88,6 +91,18 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+# Indent JSON on ?pretty=1 (added first so gzip sees the indented body)
+app.add_middleware(PrettyJSONMiddleware)
+
+# Compress HTML and JSON responses larger than 500 bytes; the admin
+# event stream is excluded so events are not held in the gzip buffer
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=500,
+    compresslevel=6,
+    exclude_paths=["/api/v1/admin/stream"]
+)
+
 # Add custom middlewares
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(RateLimitMiddleware, requests_per_minute=100)
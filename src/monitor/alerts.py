@@ -18,7 +18,7 @@ class AlertLevel(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Alert data class."""
     id: str
@@ -31,6 +31,17 @@ class Alert:
     resolved: bool = False
     resolved_at: Optional[datetime] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "message": self.message,
+            "level": self.level.value,
+            "source": self.source,
+            "timestamp": self.timestamp.isoformat(),
+            "resolved": self.resolved
+        }
+
 
 class AlertHandler(ABC):
     """Abstract base class for alert handlers."""
@@ -90,6 +101,13 @@ class AlertManager:
             return
         self._handlers: List[AlertHandler] = []
         self._alerts: List[Alert] = []
+        # Indices kept in step with _alerts so lookups never scan the history
+        self._by_id: Dict[str, Alert] = {}
+        self._by_level: Dict[AlertLevel, List[Alert]] = {level: [] for level in AlertLevel}
+        self._active: Dict[str, Alert] = {}
+        self._active_by_level: Dict[AlertLevel, Dict[str, Alert]] = {
+            level: {} for level in AlertLevel
+        }
         self._alert_counter = 0
         self._rules: List[Dict[str, Any]] = []
         self._initialized = True
@@ -122,6 +140,10 @@ class AlertManager:
         )
 
         self._alerts.append(alert)
+        self._by_id[alert.id] = alert
+        self._by_level[level].append(alert)
+        self._active[alert.id] = alert
+        self._active_by_level[level][alert.id] = alert
 
         # Send to all handlers
         for handler in self._handlers:
@@ -135,19 +157,33 @@ class AlertManager:
 
     def resolve(self, alert_id: str):
         """Mark an alert as resolved."""
-        for alert in self._alerts:
-            if alert.id == alert_id:
-                alert.resolved = True
-                alert.resolved_at = datetime.utcnow()
-                break
+        alert = self._by_id.get(alert_id)
+        if alert is None or alert.resolved:
+            return
+        alert.resolved = True
+        alert.resolved_at = datetime.utcnow()
+        self._active.pop(alert_id, None)
+        self._active_by_level[alert.level].pop(alert_id, None)
 
     def get_active_alerts(self) -> List[Alert]:
         """Get all unresolved alerts."""
-        return [a for a in self._alerts if not a.resolved]
+        return list(self._active.values())
 
     def get_alerts_by_level(self, level: AlertLevel) -> List[Alert]:
         """Get alerts by severity level."""
-        return [a for a in self._alerts if a.level == level]
+        return list(self._by_level[level])
+
+    def get_alerts(
+        self,
+        level: Optional[AlertLevel] = None,
+        active_only: bool = True
+    ) -> List[Alert]:
+        """Get alerts, optionally filtered by level and unresolved state."""
+        if level is None:
+            return self.get_active_alerts() if active_only else list(self._alerts)
+        if active_only:
+            return list(self._active_by_level[level].values())
+        return self.get_alerts_by_level(level)
 
     def add_rule(
         self,
@@ -3,6 +3,8 @@ Prometheus metrics for monitoring.
 """
 from prometheus_client import Counter, Histogram, Gauge, Info, generate_latest, CONTENT_TYPE_LATEST
 from functools import wraps
+from typing import Optional, Tuple
+import hashlib
 import time
 
 # Application info
@@ -112,6 +114,25 @@ def get_metrics():
     return generate_latest()
 
 
+# Last rendered exposition payload and its ETag, refreshed by the scheduler
+_metrics_payload: Optional[Tuple[bytes, str]] = None
+
+
+def refresh_metrics():
+    """Render all collectors once and keep the payload for scrapes."""
+    global _metrics_payload
+    body = generate_latest()
+    _metrics_payload = (body, 'W/"' + hashlib.sha1(body).hexdigest() + '"')
+    return _metrics_payload
+
+
+def get_cached_metrics():
+    """Return the last rendered (payload, ETag), rendering it if none exists yet."""
+    if _metrics_payload is None:
+        return refresh_metrics()
+    return _metrics_payload
+
+
 def get_metrics_content_type():
     """Get content type for metrics response."""
     return CONTENT_TYPE_LATEST
@@ -60,10 +60,11 @@ class PerformanceMonitor:
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
 
-        # Calculate request metrics
+        # Calculate request metrics (list() copies the deque atomically, so
+        # this is safe to run in a worker thread while requests are recorded)
         now = datetime.utcnow()
         recent_requests = [
-            r for r in self._request_times
+            r for r in list(self._request_times)
             if (now - r["timestamp"]).seconds < 60
         ]
 
@@ -121,7 +122,7 @@ class PerformanceMonitor:
                 "avg_response_time_ms": s.avg_response_time_ms,
                 "error_rate": s.error_rate
             }
-            for s in self._snapshots
+            for s in list(self._snapshots)
             if s.timestamp > cutoff
         ]
 
@@ -1,6 +1,7 @@
 """
 Report generation utilities for PDF and Excel formats.
 """
+import asyncio
 import os
 import io
 from datetime import datetime, date
@@ -445,7 +446,8 @@ class ReportService:
         else:
             generator = ExcelReportGenerator(config)
 
-        return generator.generate(report_data)
+        # Rendering is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(generator.generate, report_data)
 
     async def generate_performance_report(
         self,
@@ -496,7 +498,8 @@ class ReportService:
         else:
             generator = ExcelReportGenerator(config)
 
-        return generator.generate(report_data)
+        # Rendering is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(generator.generate, report_data)
 
 
 # Global report service instance
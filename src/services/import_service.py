@@ -8,12 +8,50 @@ from io import StringIO, BytesIO
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from src.models.data import Data
 from src.models.strategy import Strategy
 from src.core.exceptions import ValidationError, NotFoundError
 
+# 批量写入时每条 INSERT 携带的记录数
+IMPORT_CHUNK_SIZE = 1000
+
+# pyarrow 为可选依赖：可用时用其多线程 CSV 解析器，否则使用标准库 csv
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pa_csv = None
+    PYARROW_AVAILABLE = False
+
+
+def _parse_csv_rows(csv_content: str) -> List[Dict[str, Any]]:
+    """
+    解析 CSV 为字典列表
+
+    所有列均按字符串读取，与 csv.DictReader 的结果一致，由调用方自行转换类型。
+    pyarrow 无法解析的内容（如列数不一致的行）回退到 csv 模块逐行处理。
+    """
+    if PYARROW_AVAILABLE:
+        header = next(csv.reader(StringIO(csv_content)), None)
+        if header:
+            try:
+                table = pa_csv.read_csv(
+                    pa.BufferReader(csv_content.encode("utf-8")),
+                    read_options=pa_csv.ReadOptions(block_size=1 << 20),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types={name: pa.string() for name in header}
+                    )
+                )
+                return table.to_pylist()
+            except pa.ArrowInvalid:
+                pass
+
+    return list(csv.DictReader(StringIO(csv_content)))
+
 
 class ImportResult:
     """导入结果"""
@@ -50,6 +88,11 @@ class DataImportService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _insert_rows(self, rows: List[Dict[str, Any]]):
+        """分块批量写入数据记录，每块一条 executemany INSERT"""
+        for start in range(0, len(rows), IMPORT_CHUNK_SIZE):
+            await self.db.execute(insert(Data), rows[start:start + IMPORT_CHUNK_SIZE])
+
     async def import_from_csv(
         self,
         csv_content: str,
@@ -64,9 +107,9 @@ class DataImportService:
         signal,1,AAPL,2024-01-01,Buy signal,{"price": 150.0}
         """
         result = ImportResult()
+        pending: List[Dict[str, Any]] = []
 
-        reader = csv.DictReader(StringIO(csv_content))
-        rows = list(reader)
+        rows = _parse_csv_rows(csv_content)
         result.total = len(rows)
 
         for idx, row in enumerate(rows, start=1):
@@ -101,18 +144,16 @@ class DataImportService:
                         pass
 
                 # 创建数据记录
-                data = Data(
+                pending.append(dict(
                     type=row['type'].strip(),
                     strategy_id=strategy_id,
                     symbol=row['symbol'].strip(),
                     execute_date=execute_date,
                     description=row.get('description', '').strip() or None,
-                    metadata=metadata,
+                    extra_metadata=metadata,
                     user_id=user_id,
                     created_at=datetime.now(timezone.utc)
-                )
-
-                self.db.add(data)
+                ))
                 result.add_success()
 
             except Exception as e:
@@ -123,6 +164,7 @@ class DataImportService:
 
         # 提交所有成功的记录
         try:
+            await self._insert_rows(pending)
             await self.db.commit()
         except Exception as e:
             await self.db.rollback()
@@ -153,6 +195,7 @@ class DataImportService:
         """
         result = ImportResult()
         result.total = len(json_data)
+        pending: List[Dict[str, Any]] = []
 
         for idx, item in enumerate(json_data, start=1):
             try:
@@ -181,28 +224,98 @@ class DataImportService:
                         execute_date = item['execute_date']
 
                 # 创建数据记录
-                data = Data(
+                pending.append(dict(
                     type=str(item['type']).strip(),
                     strategy_id=strategy_id,
                     symbol=str(item['symbol']).strip(),
                     execute_date=execute_date,
                     description=item.get('description', '').strip() or None,
-                    metadata=item.get('metadata', {}),
+                    extra_metadata=item.get('metadata', {}),
+                    user_id=user_id,
+                    created_at=datetime.now(timezone.utc)
+                ))
+                result.add_success()
+
+            except Exception as e:
+                result.add_error(idx, str(e), item)
+                if not skip_errors:
+                    await self.db.rollback()
+                    raise
+
+        # 提交所有成功的记录
+        try:
+            await self._insert_rows(pending)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise ValidationError(f"Failed to commit data: {str(e)}")
+
+        return result
+
+    async def import_records(
+        self,
+        records: List[Dict[str, Any]],
+        user_id: int,
+        skip_errors: bool = True,
+        bulk: bool = False
+    ) -> ImportResult:
+        """
+        导入已解析的数据记录
+
+        记录字段需已是目标类型：strategy_id 为 int，execute_date 为日期，
+        metadata 为 dict。不做任何格式解析，只校验并写入。
+        bulk=True 时不构建 ORM 对象，所有记录用一条批量 INSERT 写入。
+        """
+        result = ImportResult()
+        result.total = len(records)
+        pending: List[Dict[str, Any]] = []
+
+        # 同一批记录通常引用同几个策略，每个策略只查询一次
+        known_strategies = set()
+
+        for idx, record in enumerate(records, start=1):
+            try:
+                # 验证必填字段
+                if not all([record.get('type'), record.get('strategy_id'), record.get('symbol')]):
+                    raise ValidationError("Missing required fields: type, strategy_id, symbol")
+
+                # 验证策略是否存在
+                strategy_id = record['strategy_id']
+                if strategy_id not in known_strategies:
+                    strategy_result = await self.db.execute(
+                        select(Strategy.id).where(Strategy.id == strategy_id)
+                    )
+                    if strategy_result.scalar_one_or_none() is None:
+                        raise NotFoundError("Strategy", strategy_id)
+                    known_strategies.add(strategy_id)
+
+                # 创建数据记录
+                values = dict(
+                    type=record['type'],
+                    strategy_id=strategy_id,
+                    symbol=record['symbol'],
+                    execute_date=record.get('execute_date'),
+                    description=record.get('description'),
+                    extra_metadata=record.get('metadata', {}),
                     user_id=user_id,
                     created_at=datetime.now(timezone.utc)
                 )
 
-                self.db.add(data)
+                if bulk:
+                    pending.append(values)
+                else:
+                    self.db.add(Data(**values))
                 result.add_success()
 
             except Exception as e:
-                result.add_error(idx, str(e), item)
+                result.add_error(idx, str(e), record)
                 if not skip_errors:
                     await self.db.rollback()
                     raise
 
         # 提交所有成功的记录
         try:
+            await self._insert_rows(pending)
             await self.db.commit()
         except Exception as e:
             await self.db.rollback()
@@ -227,6 +340,7 @@ class DataImportService:
             raise ValidationError("openpyxl is required for Excel import. Install it with: pip install openpyxl")
 
         result = ImportResult()
+        pending: List[Dict[str, Any]] = []
 
         try:
             workbook = openpyxl.load_workbook(BytesIO(excel_bytes))
@@ -281,18 +395,16 @@ class DataImportService:
                                 metadata = {"raw": row['metadata']}
 
                     # 创建数据记录
-                    data = Data(
+                    pending.append(dict(
                         type=str(row['type']).strip(),
                         strategy_id=strategy_id,
                         symbol=str(row['symbol']).strip(),
                         execute_date=execute_date,
                         description=str(row.get('description', '')).strip() or None,
-                        metadata=metadata,
+                        extra_metadata=metadata,
                         user_id=user_id,
                         created_at=datetime.now(timezone.utc)
-                    )
-
-                    self.db.add(data)
+                    ))
                     result.add_success()
 
                 except Exception as e:
@@ -303,6 +415,7 @@ class DataImportService:
 
             # 提交所有成功的记录
             try:
+                await self._insert_rows(pending)
                 await self.db.commit()
             except Exception as e:
                 await self.db.rollback()
@@ -1,43 +1,131 @@
 """
 Web API endpoints for monitoring and reporting.
 """
-from fastapi import APIRouter, Depends, Query, Response
-from fastapi.responses import StreamingResponse
+import asyncio
+import hashlib
+import time
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional
-from datetime import datetime
-import io
+from sqlalchemy import literal, select
+from typing import Any, Callable, Optional, Tuple
 
 from src.config.database import get_db
+from src.core.cache import dashboard_cache, report_cache
 from src.schemas.common import ResponseBase
 from src.core.dependencies import get_current_user, get_admin_user
 from src.models.user import User
 from src.models.data import Data
-from src.monitor.metrics import get_metrics, get_metrics_content_type
+from src.monitor.metrics import get_cached_metrics, get_metrics_content_type
 from src.monitor.performance import performance_monitor
 from src.monitor.dashboard import system_dashboard
 from src.monitor.alerts import alert_manager, AlertLevel
 from src.report.generator import report_service
 
+# orjson serializes the large monitoring payloads in C; fall back to the stdlib
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as MonitorJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as MonitorJSONResponse
+
 router = APIRouter(prefix="/monitor", tags=["Monitoring"])
 
+_ALERT_LEVELS = {level.value: level for level in AlertLevel}
+_METRICS_CONTENT_TYPE = get_metrics_content_type()
+
+_PDF_MEDIA_TYPE = "application/pdf"
+_XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Report format -> (media type, filename template)
+_DATA_META = {
+    "pdf": (_PDF_MEDIA_TYPE, "data_report_{ts}.pdf"),
+    "excel": (_XLSX_MEDIA_TYPE, "data_report_{ts}.xlsx"),
+}
+_PERF_META = {
+    "pdf": (_PDF_MEDIA_TYPE, "performance_report_{ts}.pdf"),
+    "excel": (_XLSX_MEDIA_TYPE, "performance_report_{ts}.xlsx"),
+}
+
+
+def _report_timestamp() -> str:
+    """UTC timestamp for report filenames, without a local timezone lookup."""
+    return time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+
+
+def _report_response(content: bytes, meta: Tuple[str, str]) -> Response:
+    """Send a generated report as a download with a timestamped filename."""
+    media_type, name_tmpl = meta
+    filename = name_tmpl.format(ts=_report_timestamp())
+    # The report is already fully in memory, so send it as one body
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+def _conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    media_type: str,
+    cache_control: str
+) -> Response:
+    """Send the body, or an empty 304 when the client already holds this ETag."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def _render_dashboard() -> Tuple[bytes, str]:
+    """Serialize the dashboard once per cache window, together with its ETag."""
+    body = MonitorJSONResponse(content={
+        "success": True,
+        "message": "Dashboard data retrieved",
+        "data": system_dashboard.get_dashboard_data()
+    }).body
+    return body, 'W/"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+# Single-flight guard so concurrent pollers share one dashboard computation
+_dashboard_lock = asyncio.Lock()
+
+
+async def _get_dashboard_payload(key: str, build: Callable[[], Any]) -> Any:
+    """Return a dashboard payload, rebuilding it at most every 5 seconds."""
+    data = await dashboard_cache.get(key)
+    if data is not None:
+        return data
+
+    async with _dashboard_lock:
+        data = await dashboard_cache.get(key)
+        if data is None:
+            # The monitors sample psutil synchronously; keep that off the event loop
+            data = await asyncio.to_thread(build)
+            await dashboard_cache.set(key, data)
+    return data
+
 
 @router.get("/metrics")
-async def prometheus_metrics():
+async def prometheus_metrics(request: Request):
     """
     Prometheus metrics endpoint.
 
-    Returns metrics in Prometheus format.
+    Returns metrics in Prometheus format. The payload is re-rendered every
+    few seconds by the scheduler, so scrapes do not walk every collector.
     """
-    return Response(
-        content=get_metrics(),
-        media_type=get_metrics_content_type()
+    body, etag = get_cached_metrics()
+    return _conditional_response(
+        request, body, etag, _METRICS_CONTENT_TYPE, "public, max-age=2"
     )
 
 
-@router.get("/dashboard", response_model=ResponseBase)
+# No response_model: the body is pre-serialized (ResponseBase-shaped) and
+# returned as a raw Response, which FastAPI never validates anyway.
+@router.get("/dashboard", response_class=MonitorJSONResponse)
 async def get_dashboard(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -45,16 +133,13 @@ async def get_dashboard(
 
     Returns system health, performance metrics, and alerts.
     """
-    data = system_dashboard.get_dashboard_data()
-
-    return ResponseBase(
-        success=True,
-        message="Dashboard data retrieved",
-        data=data
+    body, etag = await _get_dashboard_payload("dashboard", _render_dashboard)
+    return _conditional_response(
+        request, body, etag, MonitorJSONResponse.media_type, "private, max-age=2"
     )
 
 
-@router.get("/performance", response_model=ResponseBase)
+@router.get("/performance", response_model=ResponseBase, response_class=MonitorJSONResponse)
 async def get_performance(
     minutes: int = Query(60, ge=1, le=1440),
     current_user: User = Depends(get_current_user)
@@ -62,9 +147,11 @@ async def get_performance(
     """
     Get performance statistics.
     """
-    stats = performance_monitor.get_current_stats()
-    history = performance_monitor.get_history(minutes)
-    warnings = performance_monitor.check_thresholds()
+    stats, history, warnings = await asyncio.gather(
+        asyncio.to_thread(performance_monitor.get_current_stats),
+        asyncio.to_thread(performance_monitor.get_history, minutes),
+        asyncio.to_thread(performance_monitor.check_thresholds)
+    )
 
     return ResponseBase(
         success=True,
@@ -77,7 +164,7 @@ async def get_performance(
     )
 
 
-@router.get("/alerts", response_model=ResponseBase)
+@router.get("/alerts", response_model=ResponseBase, response_class=MonitorJSONResponse)
 async def get_alerts(
     level: Optional[str] = Query(None, description="Filter by level"),
     active_only: bool = Query(True, description="Only show active alerts"),
@@ -86,34 +173,17 @@ async def get_alerts(
     """
     Get system alerts.
     """
-    if active_only:
-        alerts = alert_manager.get_active_alerts()
-    else:
-        alerts = alert_manager._alerts
-
-    if level:
-        try:
-            alert_level = AlertLevel(level)
-            alerts = [a for a in alerts if a.level == alert_level]
-        except ValueError:
-            pass
+    # Unknown levels are ignored rather than rejected
+    alert_level = _ALERT_LEVELS.get(level) if level else None
+    alerts = alert_manager.get_alerts(level=alert_level, active_only=active_only)
 
-    return ResponseBase(
-        success=True,
-        message="Alerts retrieved",
-        data=[
-            {
-                "id": a.id,
-                "title": a.title,
-                "message": a.message,
-                "level": a.level.value,
-                "source": a.source,
-                "timestamp": a.timestamp.isoformat(),
-                "resolved": a.resolved
-            }
-            for a in alerts
-        ]
-    )
+    # Returned as a response directly so the list is serialized once, without
+    # the response_model validation and jsonable_encoder pass over every alert
+    return MonitorJSONResponse(content={
+        "success": True,
+        "message": "Alerts retrieved",
+        "data": [a.to_dict() for a in alerts]
+    })
 
 
 @router.post("/alerts/{alert_id}/resolve", response_model=ResponseBase)
@@ -171,20 +241,36 @@ async def download_data_report(
     """
     Download data report.
     """
-    # Fetch data
-    result = await db.execute(select(Data).limit(limit))
-    records = result.scalars().all()
+    # Fresh installs have no data at all; skip the row query and reuse the
+    # rendered empty report. It embeds its generation time, so it only lives
+    # for the report cache TTL.
+    has_any = await db.scalar(select(literal(1)).select_from(Data).limit(1))
+    if not has_any:
+        content = await report_cache.get(f"empty_data_{format}")
+        if content is None:
+            content = await report_service.generate_data_report([], format=format)
+            await report_cache.set(f"empty_data_{format}", content)
+        return _report_response(content, _DATA_META[format])
+
+    # Fetch only the reported columns; no ORM entities are needed here.
+    # The generator needs every row at once, so they are read in one go.
+    result = await db.execute(
+        select(
+            Data.id, Data.type, Data.symbol,
+            Data.execute_date, Data.status, Data.created_at
+        ).limit(limit)
+    )
 
     data_dicts = [
         {
             "id": r.id,
             "type": r.type,
             "symbol": r.symbol,
-            "execute_date": str(r.execute_date),
+            "execute_date": r.execute_date.isoformat() if r.execute_date else None,
             "status": r.status,
-            "created_at": str(r.created_at)
+            "created_at": r.created_at.isoformat(" ") if r.created_at else None
         }
-        for r in records
+        for r in result
     ]
 
     # Generate report
@@ -193,20 +279,7 @@ async def download_data_report(
         format=format
     )
 
-    # Return file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    if format == "pdf":
-        filename = f"data_report_{timestamp}.pdf"
-        media_type = "application/pdf"
-    else:
-        filename = f"data_report_{timestamp}.xlsx"
-        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-
-    return StreamingResponse(
-        io.BytesIO(content),
-        media_type=media_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return _report_response(content, _DATA_META[format])
 
 
 @router.get("/report/performance")
@@ -218,8 +291,10 @@ async def download_performance_report(
     """
     Download performance report.
     """
-    stats = performance_monitor.get_current_stats()
-    history = performance_monitor.get_history(minutes)
+    stats, history = await asyncio.gather(
+        asyncio.to_thread(performance_monitor.get_current_stats),
+        asyncio.to_thread(performance_monitor.get_history, minutes)
+    )
 
     content = await report_service.generate_performance_report(
         stats,
@@ -227,29 +302,17 @@ async def download_performance_report(
         format=format
     )
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    if format == "pdf":
-        filename = f"performance_report_{timestamp}.pdf"
-        media_type = "application/pdf"
-    else:
-        filename = f"performance_report_{timestamp}.xlsx"
-        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-
-    return StreamingResponse(
-        io.BytesIO(content),
-        media_type=media_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return _report_response(content, _PERF_META[format])
 
 
-@router.get("/summary", response_model=ResponseBase)
+@router.get("/summary", response_model=ResponseBase, response_class=MonitorJSONResponse)
 async def get_summary_report(
     current_user: User = Depends(get_current_user)
 ):
     """
     Get summary report data.
     """
-    summary = system_dashboard.get_summary_report()
+    summary = await _get_dashboard_payload("summary", system_dashboard.get_summary_report)
 
     return ResponseBase(
         success=True,
@@ -0,0 +1,602 @@
+// 启动时一次性读取存储，之后所有处理函数只访问内存中的副本
+const bootState = {
+  apiKey: localStorage.getItem('adminApiKey') || '',
+  username: localStorage.getItem('adminUsername')
+};
+
+// 空闲时再写入存储，不阻塞交互
+const scheduleIdle = window.requestIdleCallback || (cb => setTimeout(cb, 1));
+
+function persistKey(value) {
+  scheduleIdle(() => {
+    if (value) {
+      localStorage.setItem('adminApiKey', value);
+    } else {
+      localStorage.removeItem('adminApiKey');
+    }
+  });
+}
+
+// 🔒 强制登录检查 - 未登录自动跳转
+(function checkAuth() {
+  const apiKey = bootState.apiKey;
+  const username = bootState.username;
+
+  if (!apiKey) {
+    alert('⚠️ 请先登录后台！');
+    window.location.href = '/admin/login';
+    return;
+  }
+
+  // 显示用户信息
+  const userInfo = document.getElementById('userInfo');
+  if (userInfo && username) {
+    userInfo.textContent = `👤 ${username}`;
+  }
+})();
+
+// 退出登录函数
+function handleLogout() {
+  if (confirm('确定要退出登录吗？')) {
+    localStorage.removeItem('adminApiKey');
+    localStorage.removeItem('adminUsername');
+    alert('✅ 已安全退出！');
+    window.location.href = '/admin/login';
+  }
+}
+
+const keyInput = document.getElementById('apiKey');
+// 内存中缓存 API Key，避免每次请求都同步读取 localStorage
+let cachedApiKey = bootState.apiKey;
+if (cachedApiKey) keyInput.value = cachedApiKey;
+
+function getApiKey() {
+  return cachedApiKey;
+}
+
+// 输入时防抖写入 localStorage（最多每 300ms 一次）
+const debouncedSaveKey = (() => {
+  let timer;
+  return value => {
+    clearTimeout(timer);
+    timer = setTimeout(() => persistKey(value), 300);
+  };
+})();
+
+keyInput.oninput = e => {
+  cachedApiKey = e.target.value;
+  debouncedSaveKey(cachedApiKey);
+};
+
+function saveKey() {
+  cachedApiKey = keyInput.value || '';
+  persistKey(cachedApiKey);
+  showNotification('✅ API Key saved successfully');
+}
+
+function clearKey() {
+  if (confirm('Clear saved API key?')) {
+    cachedApiKey = '';
+    persistKey('');
+    keyInput.value = '';
+    showNotification('🗑️ API Key cleared');
+  }
+}
+
+function toggleKeyVisibility() {
+  keyInput.type = keyInput.type === 'password' ? 'text' : 'password';
+}
+
+// 非默认标签页的内容放在 <template> 中，首次切换时才实例化
+const tabHydrators = {
+  alerts: () => {
+    document.getElementById('alertLevel').replaceChildren(alertLevelFragment);
+    if (latestAlerts) fillAlerts(latestAlerts);
+  }
+};
+
+function hydrateTab(tabName) {
+  const host = document.getElementById(tabName);
+  if (host.dataset.hydrated) return host;
+  host.appendChild(document.getElementById(`tab-${tabName}-tpl`).content.cloneNode(true));
+  host.dataset.hydrated = '1';
+  if (tabHydrators[tabName]) tabHydrators[tabName]();
+  return host;
+}
+
+function switchTab(tabName, tabButton) {
+  document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+  document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
+  tabButton.classList.add('active');
+  hydrateTab(tabName).classList.add('active');
+}
+
+// 按 key 复用 AbortController：同一 key 的新请求会取消仍在进行的旧请求
+const controllers = new Map();
+
+function keyedFetch(key, url, opts = {}) {
+  const previous = controllers.get(key);
+  if (previous) previous.abort();
+  const controller = new AbortController();
+  controllers.set(key, controller);
+  return fetch(url, { ...opts, signal: controller.signal, keepalive: true }).finally(() => {
+    if (controllers.get(key) === controller) controllers.delete(key);
+  });
+}
+
+async function loadData(url, outId) {
+  const out = document.getElementById(outId);
+  out.__raw = undefined;
+  // 加载动画由 CSS 伪元素绘制，无需每次解析 HTML
+  out.classList.add('loading-state');
+  out.textContent = 'Loading...';
+  const key = getApiKey();
+  const headers = key ? { 'X-API-Key': key } : {};
+
+  // 由服务端输出缩进好的 JSON（?pretty=1），浏览器直接显示文本
+  const prettyUrl = url + (url.includes('?') ? '&' : '?') + 'pretty=1';
+
+  // 以输出区域 id 为 key：同一区域的新请求会取消尚未完成的旧请求
+  try {
+    const res = await keyedFetch(outId, prettyUrl, { headers });
+    out.textContent = await res.text();
+  } catch (e) {
+    if (e.name === 'AbortError') return;
+    out.textContent = '❌ Error: ' + e.message;
+  }
+  out.classList.remove('loading-state');
+}
+
+function fillMetrics(stats) {
+  const total = section => (stats[section] && stats[section].total) ?? '-';
+  document.getElementById('metricUsers').textContent = total('users');
+  document.getElementById('metricClients').textContent = total('clients');
+  document.getElementById('metricData').textContent = total('data');
+  document.getElementById('metricSubs').textContent = total('subscriptions');
+}
+
+function fillHealth(health) {
+  document.getElementById('healthOut').textContent = JSON.stringify(health, null, 2);
+}
+
+// 告警标签页可能尚未实例化，先保存数据，实例化时再填充
+let latestAlerts = null;
+
+function fillAlerts(alerts) {
+  latestAlerts = alerts;
+  const out = document.getElementById('alertsOut');
+  if (out) out.textContent = JSON.stringify(alerts, null, 2);
+}
+
+// 仪表盘所需的统计、健康状态与活跃告警通过一次请求获取
+async function loadBootstrap() {
+  const key = getApiKey();
+  const headers = key ? { 'X-API-Key': key } : {};
+
+  try {
+    const res = await keyedFetch('bootstrap', '/api/v1/admin/ui-bootstrap', { headers });
+    const data = await res.json();
+
+    if (data.success && data.data) {
+      fillMetrics(data.data.stats);
+      fillHealth(data.data.health);
+      fillAlerts(data.data.alerts);
+    }
+  } catch (e) {
+    if (e.name === 'AbortError') return;
+    console.error('Failed to load dashboard:', e);
+  }
+}
+
+function loadMetrics() {
+  return loadBootstrap();
+}
+
+// 通过一条长连接接收服务端推送的统计数据，替代轮询
+// 使用 fetch 读取事件流而非 EventSource，以便携带 X-API-Key 请求头
+async function subscribeMetrics() {
+  const key = getApiKey();
+  if (!key) return;
+
+  try {
+    const res = await fetch('/api/v1/admin/stream', { headers: { 'X-API-Key': key } });
+    if (!res.ok || !res.body) return;
+
+    const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += value;
+      const events = buffer.split('\n\n');
+      buffer = events.pop();
+      for (const event of events) {
+        const line = event.split('\n').find(l => l.startsWith('data: '));
+        if (line) fillMetrics(JSON.parse(line.slice(6)));
+      }
+    }
+  } catch (e) {
+    console.error('Metrics stream closed:', e);
+  }
+}
+
+function loadHealth() {
+  return loadBootstrap();
+}
+
+// 大对象延迟格式化：点击输出区域时才执行 JSON.stringify
+function showLazyJson(el, obj) {
+  el.__raw = obj;
+  el.textContent = '📦 Result received - click to expand';
+  if (!el.__lazyBound) {
+    el.__lazyBound = true;
+    el.addEventListener('click', () => {
+      if (el.__raw === undefined) return;
+      const raw = el.__raw;
+      el.__raw = undefined;
+      requestAnimationFrame(() => { el.textContent = JSON.stringify(raw, null, 2); });
+    });
+  }
+}
+
+function showNotification(message) {
+  const notif = document.createElement('div');
+  notif.className = 'notification glass';
+  notif.textContent = message;
+  document.body.appendChild(notif);
+  setTimeout(() => notif.remove(), 3000);
+}
+
+// 成功时只看状态码，失败时才解析响应体获取错误信息
+async function handleActionResponse(res, successMsg, onSuccess) {
+  if (res.ok) {
+    showNotification('✅ ' + successMsg);
+    if (onSuccess) await onSuccess();
+    return true;
+  }
+  const data = await res.json().catch(() => ({ message: res.statusText }));
+  showNotification('❌ Failed: ' + (data.message || data.detail || res.statusText));
+  return false;
+}
+
+async function loadAlerts(type) {
+  const url = type === 'all'
+    ? '/api/v1/monitor/alerts?active_only=false'
+    : '/api/v1/monitor/alerts?active_only=true';
+  await loadData(url, 'alertsOut');
+}
+
+async function testAlert() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const url = '/api/v1/monitor/alerts/test?title=Test+Alert&message=This+is+a+test+alert&level=info';
+  try {
+    const res = await fetch(url, {
+      method: 'POST',
+      headers: { 'X-API-Key': key }
+    });
+    await handleActionResponse(res, 'Test alert sent!');
+  } catch (e) {
+    showNotification('❌ Error: ' + e.message);
+  }
+}
+
+async function createTestAlert() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const params = new URLSearchParams({
+    title: document.getElementById('alertTitle').value || 'Test Alert',
+    message: document.getElementById('alertMessage').value || 'This is a test alert',
+    level: document.getElementById('alertLevel').value
+  });
+  const url = '/api/v1/monitor/alerts/test?' + params;
+
+  try {
+    const res = await fetch(url, {
+      method: 'POST',
+      headers: { 'X-API-Key': key }
+    });
+    await handleActionResponse(res, 'Alert created successfully!', () => loadAlerts('active'));
+  } catch (e) {
+    showNotification('❌ Error: ' + e.message);
+  }
+}
+
+// 告警级别选项只构建一次，告警标签页实例化时以 DocumentFragment 批量插入
+const ALERT_LEVELS = Object.freeze([
+  Object.freeze({ value: 'info', label: 'ℹ️ Info' }),
+  Object.freeze({ value: 'warning', label: '⚠️ Warning' }),
+  Object.freeze({ value: 'error', label: '❌ Error' }),
+  Object.freeze({ value: 'critical', label: '🔥 Critical' })
+]);
+const alertLevelFragment = document.createDocumentFragment();
+ALERT_LEVELS.forEach(({ value, label }) => {
+  const option = document.createElement('option');
+  option.value = value;
+  option.textContent = label;
+  alertLevelFragment.appendChild(option);
+});
+
+// ========== User Management ==========
+function loadUsers() {
+  showNotification('ℹ️ Note: Full user list requires CLI access');
+  return loadData('/api/v1/auth/me', 'usersOut');
+}
+
+function resetUserForm() {
+  hideCreateUser();
+  document.getElementById('newUsername').value = '';
+  document.getElementById('newEmail').value = '';
+  document.getElementById('newPassword').value = '';
+  document.getElementById('newIsAdmin').checked = false;
+}
+
+function showCreateUser() {
+  document.getElementById('createUserModal').style.display = 'block';
+}
+
+function hideCreateUser() {
+  document.getElementById('createUserModal').style.display = 'none';
+}
+
+async function createUser() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const username = document.getElementById('newUsername').value;
+  const email = document.getElementById('newEmail').value;
+  const password = document.getElementById('newPassword').value;
+  const is_admin = document.getElementById('newIsAdmin').checked;
+
+  if (!username || !email || !password) {
+    showNotification('❌ Please fill all required fields');
+    return;
+  }
+
+  try {
+    const res = await fetch('/api/v1/auth/register', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-API-Key': key
+      },
+      body: JSON.stringify({ username, email, password, is_admin })
+    });
+    // 刷新列表与重置表单并行进行
+    await handleActionResponse(res, 'User created successfully!', () =>
+      Promise.all([loadUsers(), Promise.resolve().then(resetUserForm)])
+    );
+  } catch (e) {
+    showNotification('❌ Error: ' + e.message);
+  }
+}
+
+// ========== Client Management ==========
+function showCreateClient() {
+  document.getElementById('createClientModal').style.display = 'block';
+}
+
+function hideCreateClient() {
+  document.getElementById('createClientModal').style.display = 'none';
+}
+
+async function createClient() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const name = document.getElementById('newClientName').value;
+  const description = document.getElementById('newClientDesc').value;
+  const contact_email = document.getElementById('newClientEmail').value;
+
+  if (!name) {
+    showNotification('❌ Client name is required');
+    return;
+  }
+
+  try {
+    const res = await fetch('/api/v1/clients', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-API-Key': key
+      },
+      body: JSON.stringify({ name, description, contact_email })
+    });
+    const data = await res.json();
+
+    if (data.success) {
+      showNotification('✅ Client created! Save the credentials securely!');
+      showLazyJson(document.getElementById('clientsOut'), data.data);
+      hideCreateClient();
+      // Clear form
+      document.getElementById('newClientName').value = '';
+      document.getElementById('newClientDesc').value = '';
+      document.getElementById('newClientEmail').value = '';
+    } else {
+      showNotification('❌ Failed: ' + data.message);
+    }
+  } catch (e) {
+    showNotification('❌ Error: ' + e.message);
+  }
+}
+
+// ========== Strategy Management ==========
+function showCreateStrategy() {
+  document.getElementById('createStrategyModal').style.display = 'block';
+}
+
+function hideCreateStrategy() {
+  document.getElementById('createStrategyModal').style.display = 'none';
+}
+
+function resetStrategyForm() {
+  hideCreateStrategy();
+  document.getElementById('newStrategyId').value = '';
+  document.getElementById('newStrategyName').value = '';
+  document.getElementById('newStrategyType').value = 'default';
+  document.getElementById('newStrategyDesc').value = '';
+}
+
+async function createStrategy() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const strategy_id = document.getElementById('newStrategyId').value;
+  const name = document.getElementById('newStrategyName').value;
+  const type = document.getElementById('newStrategyType').value;
+  const description = document.getElementById('newStrategyDesc').value;
+
+  if (!strategy_id || !name) {
+    showNotification('❌ Strategy ID and Name are required');
+    return;
+  }
+
+  try {
+    const res = await fetch('/api/v1/strategies', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-API-Key': key
+      },
+      body: JSON.stringify({ strategy_id, name, type, description })
+    });
+    await handleActionResponse(res, 'Strategy created successfully!', () =>
+      Promise.all([
+        loadData('/api/v1/strategies', 'strategiesOut'),
+        Promise.resolve().then(resetStrategyForm)
+      ])
+    );
+  } catch (e) {
+    showNotification('❌ Error: ' + e.message);
+  }
+}
+
+// ========== Role & Permission Management ==========
+function showCreateRole() {
+  document.getElementById('createRoleModal').style.display = 'block';
+}
+
+function hideCreateRole() {
+  document.getElementById('createRoleModal').style.display = 'none';
+}
+
+async function createRole() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const code = document.getElementById('newRoleCode').value;
+  const name = document.getElementById('newRoleName').value;
+
+  if (!code || !name) {
+    showNotification('❌ Role code and name are required');
+    return;
+  }
+
+  showNotification('ℹ️ Role creation requires database access via CLI');
+  hideCreateRole();
+}
+
+function showCreatePermission() {
+  document.getElementById('createPermModal').style.display = 'block';
+}
+
+function hideCreatePermission() {
+  document.getElementById('createPermModal').style.display = 'none';
+}
+
+async function createPermission() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const code = document.getElementById('newPermCode').value;
+  const name = document.getElementById('newPermName').value;
+
+  if (!code || !name) {
+    showNotification('❌ Permission code and name are required');
+    return;
+  }
+
+  showNotification('ℹ️ Permission creation requires database access via CLI');
+  hideCreatePermission();
+}
+
+async function assignRoleToClient() {
+  const key = getApiKey();
+  if (!key) {
+    showNotification('⚠️ Please set API Key first');
+    return;
+  }
+
+  const clientId = document.getElementById('assignClientId').value;
+  const roleCode = document.getElementById('assignRoleCode').value;
+
+  if (!clientId || !roleCode) {
+    showNotification('❌ Client ID and Role Code are required');
+    return;
+  }
+
+  try {
+    const res = await fetch(`/api/v1/admin/clients/${clientId}/roles/${roleCode}`, {
+      method: 'POST',
+      headers: { 'X-API-Key': key }
+    });
+    await handleActionResponse(res, 'Role assigned successfully!', () => {
+      document.getElementById('assignClientId').value = '';
+      document.getElementById('assignRoleCode').value = '';
+    });
+  } catch (e) {
+    showNotification('❌ Error: ' + e.message);
+  }
+}
+
+// 页面上所有按钮统一通过 data-action 事件委托处理，参数取自 data-* 属性
+const actions = {
+  switchTab: (e, d, el) => switchTab(d.tab, el),
+  loadData: (e, d) => loadData(d.url, d.out),
+  loadAlerts: (e, d) => loadAlerts(d.type),
+  handleLogout, saveKey, clearKey, toggleKeyVisibility,
+  loadMetrics, loadHealth, loadUsers, testAlert, createTestAlert, assignRoleToClient,
+  showCreateUser, hideCreateUser, createUser,
+  showCreateClient, hideCreateClient, createClient,
+  showCreateStrategy, hideCreateStrategy, createStrategy,
+  showCreateRole, hideCreateRole, createRole,
+  showCreatePermission, hideCreatePermission, createPermission
+};
+
+document.addEventListener('click', e => {
+  const el = e.target.closest('[data-action]');
+  if (el && actions[el.dataset.action]) actions[el.dataset.action](e, el.dataset, el);
+});
+
+// 页面不可见时暂停背景与状态徽章的无限动画
+document.addEventListener('visibilitychange', () => {
+  document.body.classList.toggle('paused', document.hidden);
+});
+
+// Auto-load dashboard data
+if (cachedApiKey) {
+  loadBootstrap().then(subscribeMetrics);
+}
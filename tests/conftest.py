@@ -2,42 +2,44 @@
 Pytest configuration and fixtures.
 """
 import os
-import sys
 import asyncio
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Callable, Dict, Generator
 
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+from fastapi.testclient import TestClient
+from httpx import AsyncClient, ASGITransport, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
-# Add src to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Cheap bcrypt cost for tests only (each round doubles hashing time);
+# must be set before settings are loaded
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
-from src.config.database import Base, get_db
+from src.config.database import get_db
 from src.main import app
+from tests.helpers import create_test_schema, make_test_engine
 
 
-# Test database URL
+# Test database URL. Each pytest-xdist worker is its own process, so every
+# worker already gets a private in-memory database.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
 # Create test engine
-test_engine = create_async_engine(
-    TEST_DATABASE_URL,
-    echo=False,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool
-)
-
-test_session_maker = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False
-)
+test_engine = make_test_engine(TEST_DATABASE_URL)
+
+
+# pysqlite (and so aiosqlite) manages BEGIN itself and breaks SAVEPOINT;
+# take over transaction control so per-test savepoints roll back cleanly.
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 @pytest.fixture(scope="session")
@@ -45,94 +47,225 @@ def event_loop() -> Generator:
     """Create event loop for async tests."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
+    loop.run_until_complete(loop.shutdown_asyncgens())
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def _db_schema(event_loop) -> Generator[None, None, None]:
+    """
+    Create all tables once for the whole test session.
+
+    Driven synchronously on the session loop so the engine is disposed
+    before ``event_loop`` closes it.
+    """
+    event_loop.run_until_complete(create_test_schema(test_engine))
+    yield
+    event_loop.run_until_complete(test_engine.dispose())
+
+
 @pytest_asyncio.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a fresh database session for each test."""
-    # Create all tables
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+async def db_session(_db_schema) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a database session for each test.
+
+    The session is joined to an outer transaction that is rolled back at
+    teardown; commits inside the test only release a SAVEPOINT, so every
+    test starts from empty tables without re-running any DDL.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+            autoflush=False
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches() -> Generator[None, None, None]:
+    """
+    Start every test with empty application caches.
+
+    The caches are process-wide singletons while the database is rolled back
+    after each test, so entries cached by one test must not reach the next.
+    Synchronous on purpose: it also wraps sync tests, whose teardown may run
+    after the session event loop has closed. No test is running between
+    tests, so the stores can be cleared without taking the cache locks.
+    """
+    from src.core.cache import cache_manager
+
+    for cache in (cache_manager._default_cache, *cache_manager._caches.values()):
+        cache._cache.clear()
+    yield
 
-    async with test_session_maker() as session:
-        yield session
 
-    # Drop all tables after test
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+@pytest.fixture(scope="session")
+def _http_client(event_loop) -> Generator[AsyncClient, None, None]:
+    """
+    Create one ASGI test client shared by the whole session.
+
+    Closed on the session loop before ``event_loop`` tears down, like
+    ``_db_schema``.
+    """
+    transport = ASGITransport(app=app)
+    ac = AsyncClient(transport=transport, base_url="http://test")
+    yield ac
+    event_loop.run_until_complete(ac.aclose())
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create test client with database override."""
+async def client(
+    _http_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """Hand out the shared test client with this test's database override."""
 
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    yield _http_client
 
     app.dependency_overrides.clear()
+    # Nothing set by one test may leak into the next through the shared client
+    _http_client.cookies.clear()
+
+
+@pytest.fixture(scope="session")
+def ui_client() -> TestClient:
+    """
+    One synchronous client for the server-rendered admin pages.
+
+    Deliberately not entered as a context manager, so the app lifespan
+    (database init, scheduler) never runs; these pages need neither.
+    """
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def ui_get(ui_client: TestClient) -> Callable[[str], Response]:
+    """
+    GET through ui_client, memoized per path for the whole session.
+
+    For content assertions on the static admin pages only; tests about
+    caching headers or conditional requests must use ui_client directly.
+    """
+    responses: Dict[str, Response] = {}
+
+    def get(path: str) -> Response:
+        if path not in responses:
+            responses[path] = ui_client.get(path)
+        return responses[path]
+
+    return get
+
+
+TEST_PASSWORD = "testpassword123"
+
+
+@pytest.fixture(scope="session")
+def _test_credentials() -> dict:
+    """
+    Hash the fixture password and generate keys once per session.
+
+    bcrypt is deliberately slow, so the per-test user fixtures insert these
+    precomputed values directly instead of going through the services.
+    """
+    from src.core.security import (
+        generate_api_key, generate_client_credentials, get_password_hash
+    )
+
+    def credentials():
+        api_key, hashed_key = generate_api_key()
+        client_key, client_secret, hashed_secret = generate_client_credentials()
+        return {
+            "api_key": api_key,
+            "hashed_key": hashed_key,
+            "client_key": client_key,
+            "client_secret": client_secret,
+            "hashed_secret": hashed_secret
+        }
+
+    return {
+        "hashed_password": get_password_hash(TEST_PASSWORD),
+        "user": credentials(),
+        "client": credentials()
+    }
 
 
 @pytest_asyncio.fixture
-async def test_user(db_session: AsyncSession):
+async def test_user(db_session: AsyncSession, _test_credentials):
     """Create a test user."""
-    from src.services.auth_service import AuthService
-    from src.schemas.user import UserCreate
+    from src.models.user import User
+    from src.core.security import calculate_expiry
 
-    auth_service = AuthService(db_session)
-    user_data = UserCreate(
+    creds = _test_credentials["user"]
+    user = User(
         username="testuser",
         email="test@example.com",
-        password="testpassword123",
-        full_name="Test User"
+        hashed_password=_test_credentials["hashed_password"],
+        api_key=creds["hashed_key"],
+        api_key_expires_at=calculate_expiry(days=365),
+        client_key=creds["client_key"],
+        client_secret=creds["hashed_secret"],
+        full_name="Test User",
+        is_active=True,
+        is_admin=False
     )
-    user, api_key = await auth_service.register_user(user_data)
+    db_session.add(user)
+    await db_session.commit()
 
-    return {"user": user, "api_key": api_key}
+    return {"user": user, "api_key": creds["api_key"]}
 
 
 @pytest_asyncio.fixture
-async def test_client_app(db_session: AsyncSession, test_user):
+async def test_client_app(db_session: AsyncSession, test_user, _test_credentials):
     """Create a test client application."""
-    from src.services.client_service import ClientService
-    from src.schemas.client import ClientCreate
-
-    client_service = ClientService(db_session)
-    client_data = ClientCreate(
-        name="Test Client",
-        description="Test client application"
-    )
-    client, client_secret = await client_service.create_client(
-        client_data, test_user["user"].id
+    from src.models.user import User
+
+    creds = _test_credentials["client"]
+    client = User(
+        username="Test Client",
+        email="client@example.com",
+        hashed_password=_test_credentials["hashed_password"],
+        api_key=creds["hashed_key"],
+        client_key=creds["client_key"],
+        client_secret=creds["hashed_secret"],
+        description="Test client application",
+        is_active=True,
+        is_admin=False
     )
+    db_session.add(client)
+    await db_session.commit()
 
     return {
         "client": client,
         "client_key": client.client_key,
-        "client_secret": client_secret
+        "client_secret": creds["client_secret"]
     }
 
 
 @pytest_asyncio.fixture
 async def test_strategy(db_session: AsyncSession):
     """Create a test strategy."""
-    from src.services.strategy_service import StrategyService
-    from src.schemas.strategy import StrategyCreate
+    from src.models.strategy import Strategy
 
-    strategy_service = StrategyService(db_session)
-    strategy_data = StrategyCreate(
+    strategy = Strategy(
         strategy_id="test_strategy_001",
         name="Test Strategy",
         description="A test strategy",
-        type="default"
+        type="default",
+        is_active=True
     )
-    strategy = await strategy_service.create_strategy(strategy_data)
+    db_session.add(strategy)
+    await db_session.commit()
 
     return strategy
 
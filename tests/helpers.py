@@ -0,0 +1,98 @@
+"""
+Shared helpers for test database setup.
+"""
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.config.database import Base
+from src.core.security import get_password_hash
+import src.models  # noqa: F401  (registers every table before the DDL is compiled)
+
+# Test databases are throwaway: no durability, everything kept in memory
+SQLITE_TEST_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def make_test_engine(url: str = "sqlite+aiosqlite:///:memory:") -> AsyncEngine:
+    """Create an aiosqlite engine tuned for tests."""
+    engine = create_async_engine(
+        url,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_TEST_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
+@lru_cache(maxsize=None)
+def schema_ddl() -> str:
+    """Compile the CREATE TABLE/INDEX statements for all models once."""
+    dialect = sqlite.dialect()
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)).strip())
+        for index in table.indexes:
+            statements.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return ";\n".join(statements) + ";"
+
+
+async def create_test_schema(engine: AsyncEngine) -> None:
+    """
+    Create all tables on a test engine with a single executescript call.
+
+    Equivalent to Base.metadata.create_all, minus the metadata reflection
+    and one driver round-trip per table and index.
+    """
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.executescript(schema_ddl())
+
+
+@asynccontextmanager
+async def standalone_session() -> AsyncIterator[AsyncSession]:
+    """
+    Session on a fresh in-memory database, for test scripts run outside pytest.
+
+    Under pytest the same tests take the savepoint-wrapped db_session fixture
+    from conftest.py and share one schema instead.
+    """
+    engine = make_test_engine()
+    await create_test_schema(engine)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            yield session
+    finally:
+        await engine.dispose()
+
+
+@lru_cache(maxsize=32)
+def cached_password_hash(password: str) -> str:
+    """
+    Hash each distinct test password only once per process.
+
+    bcrypt embeds the salt in the hash, so one hash verifies as well as a
+    fresh one; reusing it skips the key schedule on every repeat call.
+    """
+    return get_password_hash(password)
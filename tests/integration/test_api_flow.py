@@ -23,48 +23,50 @@ class TestAuthAPI:
     """Test authentication API endpoints."""
 
     @pytest.mark.asyncio
-    async def test_register_user(self, client: AsyncClient):
-        """Test user registration via API."""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "username": "apiuser",
-                "email": "apiuser@example.com",
-                "password": "securepassword123",
-                "full_name": "API User"
-            }
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "api_key" in data["data"]
-        assert data["data"]["user"]["username"] == "apiuser"
-
-    @pytest.mark.asyncio
-    async def test_register_duplicate_username(self, client: AsyncClient):
-        """Test registration with duplicate username."""
-        # First registration
-        await client.post(
-            "/api/v1/auth/register",
-            json={
-                "username": "duplicate",
-                "email": "first@example.com",
-                "password": "password123"
-            }
-        )
-
-        # Second registration with same username
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "username": "duplicate",
-                "email": "second@example.com",
-                "password": "password123"
-            }
-        )
-
-        assert response.status_code == 409
+    @pytest.mark.parametrize(
+        "existing, payload, expected_status",
+        [
+            (
+                None,
+                {
+                    "username": "apiuser",
+                    "email": "apiuser@example.com",
+                    "password": "securepassword123",
+                    "full_name": "API User"
+                },
+                200
+            ),
+            (
+                {
+                    "username": "duplicate",
+                    "email": "first@example.com",
+                    "password": "password123"
+                },
+                {
+                    "username": "duplicate",
+                    "email": "second@example.com",
+                    "password": "password123"
+                },
+                409
+            ),
+        ],
+        ids=["new_user", "duplicate_username"]
+    )
+    async def test_register(
+        self, client: AsyncClient, existing, payload, expected_status
+    ):
+        """Test user registration via API, including duplicate usernames."""
+        if existing:
+            await client.post("/api/v1/auth/register", json=existing)
+
+        response = await client.post("/api/v1/auth/register", json=payload)
+
+        assert response.status_code == expected_status
+        if expected_status == 200:
+            data = response.json()
+            assert data["success"] is True
+            assert "api_key" in data["data"]
+            assert data["data"]["user"]["username"] == payload["username"]
 
     @pytest.mark.asyncio
     async def test_login_success(self, client: AsyncClient):
@@ -339,3 +341,21 @@ class TestAdminAPI:
         )
 
         assert response.status_code == 403
+
+
+class TestMonitorAPI:
+    """Test monitoring endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_not_modified(self, client: AsyncClient):
+        """Test Prometheus metrics revalidate with their ETag."""
+        response = await client.get("/api/v1/monitor/metrics")
+
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await client.get(
+            "/api/v1/monitor/metrics",
+            headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
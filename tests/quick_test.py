@@ -1,17 +1,24 @@
 """Quick test to verify bcrypt fix and basic functionality"""
 import asyncio
-import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sys
+
+# Run directly (python tests/quick_test.py): put the project root on the
+# path and use the cheapest bcrypt cost; under pytest, pytest.ini's
+# pythonpath and conftest.py take care of both
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
-from src.core.security import get_password_hash, verify_password, generate_client_credentials
+from src.core.security import verify_password, generate_client_credentials
+from tests.helpers import cached_password_hash, standalone_session
 
 async def test_security():
     print("Testing security module...")
 
     # Test password hashing
     password = "test123"
-    hashed = get_password_hash(password)
+    hashed = cached_password_hash(password)
     print(f"✓ Password hashed: {hashed[:50]}...")
 
     # Test password verification
@@ -25,50 +32,37 @@ async def test_security():
 
     print("\n✅ All security tests passed!")
 
-async def test_auth_service():
+async def test_auth_service(db_session):
     print("\nTesting auth service...")
-    from src.config.database import get_db, init_db
     from src.services.auth_service import AuthService
     from src.schemas.user import UserCreate
-    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-    from sqlalchemy.pool import StaticPool
-    from src.config.database import Base
 
-    # Create in-memory test database
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool
-    )
-
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    auth_service = AuthService(db_session)
 
-    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with session_maker() as session:
-        auth_service = AuthService(session)
+    # Test user registration
+    user_data = UserCreate(
+        username="testuser",
+        email="test@example.com",
+        password="testpass123",
+        full_name="Test User"
+    )
 
-        # Test user registration
-        user_data = UserCreate(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            full_name="Test User"
-        )
+    user, api_key = await auth_service.register_user(user_data)
+    print(f"✓ User registered: {user.username}")
+    print(f"✓ API key generated: {api_key[:20]}...")
+    print(f"✓ Client key: {user.client_key}")
 
-        user, api_key = await auth_service.register_user(user_data)
-        print(f"✓ User registered: {user.username}")
-        print(f"✓ API key generated: {api_key[:20]}...")
-        print(f"✓ Client key: {user.client_key}")
+    # Test authentication
+    auth_user = await auth_service.authenticate_user("testuser", "testpass123")
+    print(f"✓ User authenticated: {auth_user.username}")
 
-        # Test authentication
-        auth_user = await auth_service.authenticate_user("testuser", "testpass123")
-        print(f"✓ User authenticated: {auth_user.username}")
+    print("\n✅ All auth service tests passed!")
 
-        print("\n✅ All auth service tests passed!")
+async def _run_auth_service():
+    async with standalone_session() as session:
+        await test_auth_service(session)
 
 if __name__ == "__main__":
     asyncio.run(test_security())
-    asyncio.run(test_auth_service())
+    asyncio.run(_run_auth_service())
     print("\n🎉 All tests completed successfully!")
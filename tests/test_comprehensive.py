@@ -0,0 +1,182 @@
+"""
+综合功能测试
+覆盖所有核心功能和新增功能，数据库、用户和策略复用 conftest 中的夹具
+"""
+from datetime import date
+
+import pytest
+
+from src.core.cache import LRUCache
+from src.core.exceptions import AuthenticationError
+from src.core.ip_control import IPAccessControl
+from src.core.scheduler import scheduler
+from src.core.security import (
+    get_password_hash, verify_password,
+    generate_api_key, generate_client_credentials
+)
+from src.schemas.user import UserCreate
+from src.services.auth_service import AuthService
+from src.services.import_service import DataImportService
+
+# 认证测试用户，模块加载时只校验一次
+TEST_USER_CREATE = UserCreate(
+    username="authuser",
+    email="authuser@example.com",
+    password="testpass123",
+    full_name="Auth User"
+)
+
+# 预解析的导入记录（已是目标类型），模块加载时构建一次；
+# strategy_id 在测试时按实际策略填入
+IMPORT_RECORDS = [
+    {
+        "type": "signal",
+        "symbol": "MSFT",
+        "execute_date": date(2024, 1, 3),
+        "description": "Sell signal",
+        "metadata": {"price": 300.0}
+    },
+    {
+        "type": "data",
+        "symbol": "TSLA",
+        "execute_date": date(2024, 1, 4),
+        "description": "Market data",
+        "metadata": {"volume": 500000}
+    }
+]
+
+
+def test_security():
+    """测试安全模块"""
+    # 密码哈希与验证
+    password = "test123"
+    hashed = get_password_hash(password)
+    assert hashed, "密码哈希失败"
+    assert verify_password(password, hashed), "密码验证失败"
+    assert not verify_password("wrong", hashed), "错误密码验证应该失败"
+
+    # API Key 生成
+    api_key, hashed_key = generate_api_key()
+    assert api_key.startswith("sk_"), "API Key 格式错误"
+    assert len(api_key) > 32, "API Key 长度不足"
+
+    # 客户端凭证生成
+    client_key, client_secret, hashed_secret = generate_client_credentials()
+    assert client_key.startswith("ck_"), "Client Key 格式错误"
+    assert client_secret.startswith("cs_"), "Client Secret 格式错误"
+
+
+@pytest.mark.asyncio
+async def test_auth_service(db_session):
+    """测试认证服务"""
+    auth_service = AuthService(db_session)
+
+    # 用户注册
+    user, api_key = await auth_service.register_user(TEST_USER_CREATE)
+    assert user.username == TEST_USER_CREATE.username, "用户名不匹配"
+    assert user.client_key, "client_key 未生成"
+    assert api_key, "API key 未返回"
+
+    # 用户认证
+    auth_user = await auth_service.authenticate_user(
+        TEST_USER_CREATE.username, TEST_USER_CREATE.password
+    )
+    assert auth_user.id == user.id, "认证用户不匹配"
+
+    # 错误密码
+    with pytest.raises(AuthenticationError):
+        await auth_service.authenticate_user(TEST_USER_CREATE.username, "wrongpass")
+
+    # API Key 重新生成
+    new_api_key = await auth_service.regenerate_api_key(user.id)
+    assert new_api_key, "新 API key 未生成"
+    assert new_api_key != api_key, "新旧 API key 相同"
+
+
+@pytest.mark.asyncio
+async def test_data_import_service(db_session, test_user, test_strategy):
+    """测试数据导入服务"""
+    user_id = test_user["user"].id
+    import_service = DataImportService(db_session)
+
+    # CSV 导入（端到端覆盖解析器）
+    csv_content = f"""type,strategy_id,symbol,execute_date,description,metadata
+signal,{test_strategy.id},AAPL,2024-01-01,Buy signal,"{{\\"price\\": 150.0}}"
+data,{test_strategy.id},GOOGL,2024-01-02,Market data,"{{\\"volume\\": 1000000}}"
+"""
+    result = await import_service.import_from_csv(csv_content, user_id)
+    assert result.total == 2, f"总数应为2，实际为{result.total}"
+    assert result.success == 2, f"成功数应为2，实际为{result.success}"
+    assert result.failed == 0, f"失败数应为0，实际为{result.failed}"
+
+    # 预解析记录导入（不经过 CSV/JSON 解析），逐条与批量两种写入路径
+    records = [dict(r, strategy_id=test_strategy.id) for r in IMPORT_RECORDS]
+    for bulk in (False, True):
+        result = await import_service.import_records(records, user_id, bulk=bulk)
+        assert result.success == len(IMPORT_RECORDS), f"记录导入失败: {result.errors}"
+
+    # 数据验证
+    validation_result = await import_service.validate_import_data([
+        {"type": "signal", "strategy_id": 1, "symbol": "TEST"}
+    ])
+    assert validation_result["is_valid"], "验证应该通过"
+
+
+def test_ip_control():
+    """测试 IP 访问控制"""
+    ip_control = IPAccessControl()
+
+    # IP 格式验证
+    assert ip_control.is_valid_ip("192.168.1.1"), "有效 IP 验证失败"
+    assert ip_control.is_valid_ip("2001:db8::1"), "有效 IPv6 验证失败"
+    assert not ip_control.is_valid_ip("invalid"), "无效 IP 应该验证失败"
+
+    # 网络段检查
+    assert ip_control.is_in_network("192.168.1.10", "192.168.1.0/24"), "网络段检查失败"
+    assert not ip_control.is_in_network("192.168.2.10", "192.168.1.0/24"), "网络段检查应该失败"
+
+    # 批量网络段检查与逐个检查结果一致
+    ips = ["192.168.1.10", "192.168.2.10", "invalid", "2001:db8::1"]
+    expected = [ip_control.is_in_network(ip, "192.168.1.0/24") for ip in ips]
+    assert ip_control.is_in_network_batch(ips, "192.168.1.0/24") == expected, "批量网络段检查失败"
+    assert ip_control.is_in_network_batch(["2001:db8::1"], "2001:db8::/32") == [True], "IPv6 批量检查失败"
+
+
+@pytest.mark.asyncio
+async def test_cache_system():
+    """测试缓存系统"""
+    cache = LRUCache(max_size=1000, default_ttl=300)
+
+    # 设置和获取
+    await cache.set("test_key", "test_value", ttl=60)
+    assert await cache.get("test_key") == "test_value", "缓存值不匹配"
+
+    # 删除
+    await cache.delete("test_key")
+    assert await cache.get("test_key") is None, "缓存应该被删除"
+
+    # LRU 淘汰：容量设为 2，写入第三个键即可触发淘汰
+    small = LRUCache(max_size=2, default_ttl=300)
+    await small.set("a", 1)
+    await small.set("b", 2)
+    await small.set("c", 3)
+    assert await small.get("a") is None, "LRU 淘汰未生效"
+    assert await small.get("c") == 3, "最新的键不应被淘汰"
+
+
+def test_scheduler():
+    """测试调度器"""
+    scheduler.add_task(
+        task_id="test_task",
+        name="测试任务",
+        func=lambda: None,
+        interval_seconds=1
+    )
+    try:
+        status = scheduler.get_status()
+        assert "test_task" in [task["id"] for task in status["tasks"]], "任务未添加"
+    finally:
+        scheduler.remove_task("test_task")
+
+    status = scheduler.get_status()
+    assert "test_task" not in [task["id"] for task in status["tasks"]], "任务未移除"
@@ -5,9 +5,6 @@
 """
 import asyncio
 import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 async def test_admin_login_api():
     """测试管理员登录API"""
@@ -1,8 +1,6 @@
 """
 Test permission checking functionality.
 """
-import sys
-sys.path.insert(0, 'E:\\Workplace-Pycharm\\signal-transceiver')
 
 def test_require_permissions():
     """Test that require_permissions creates PermissionChecker correctly."""
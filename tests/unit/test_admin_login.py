@@ -1,39 +1,53 @@
 """
 Tests for Admin Login and CRUD UI features.
 """
+import re
+from typing import Callable, List
+
 import pytest
-from fastapi.testclient import TestClient
-from src.main import app
+from httpx import Response
+
+
+def get_admin_ui_source(get: Callable[[str], Response]) -> str:
+    """Return the admin UI page together with the script it references."""
+    page = get("/admin/ui").text
+    script_url = re.search(r'<script src="([^"]+)"', page).group(1)
+    return page + get(script_url).text
 
 
-client = TestClient(app)
+def assert_all_in(text: str, needles: List[str]) -> None:
+    """Assert that every needle occurs in text, scanning text once."""
+    found = set(re.findall("|".join(map(re.escape, needles)), text))
+    # A match can shadow an overlapping needle; only those get a second look
+    missing = [needle for needle in needles if needle not in found and needle not in text]
+    assert not missing, f"missing from page: {missing}"
 
 
 class TestAdminLogin:
     """Test admin login page."""
 
-    def test_admin_login_page_loads(self):
+    def test_admin_login_page_loads(self, ui_get):
         """Test that login page loads successfully."""
-        response = client.get("/admin/login")
+        response = ui_get("/admin/login")
         assert response.status_code == 200
         assert "Signal Transceiver" in response.text
 
-    def test_login_page_has_form(self):
+    def test_login_page_has_form(self, ui_get):
         """Test that login page contains form elements."""
-        response = client.get("/admin/login")
+        response = ui_get("/admin/login")
         assert '<form id="loginForm"' in response.text
         assert 'id="username"' in response.text
         assert 'id="password"' in response.text
 
-    def test_login_page_glassmorphism(self):
+    def test_login_page_glassmorphism(self, ui_get):
         """Test that login page has glassmorphism effects."""
-        response = client.get("/admin/login")
+        response = ui_get("/admin/login")
         assert "backdrop-filter" in response.text
         assert "rgba(255, 255, 255, 0.25)" in response.text
 
-    def test_logout_page(self):
+    def test_logout_page(self, ui_get):
         """Test logout endpoint."""
-        response = client.get("/admin/logout")
+        response = ui_get("/admin/logout")
         assert response.status_code == 200
         assert "localStorage.removeItem" in response.text
 
@@ -41,45 +55,46 @@ class TestAdminLogin:
 class TestAdminUICRUD:
     """Test Admin UI CRUD features."""
 
-    def test_admin_ui_user_crud(self):
+    def test_admin_ui_user_crud(self, ui_get):
         """Test user CRUD interface."""
-        response = client.get("/admin/ui")
+        response = ui_get("/admin/ui")
         assert response.status_code == 200
-        assert "showCreateUser" in response.text
-        assert "createUserModal" in response.text
-        assert "newUsername" in response.text
+        source = get_admin_ui_source(ui_get)
+        assert "showCreateUser" in source
+        assert "createUserModal" in source
+        assert "newUsername" in source
 
-    def test_admin_ui_client_crud(self):
+    def test_admin_ui_client_crud(self, ui_get):
         """Test client CRUD interface."""
-        response = client.get("/admin/ui")
-        assert "createClient(" in response.text
-        assert "createClientModal" in response.text
-        assert "newClientName" in response.text
+        source = get_admin_ui_source(ui_get)
+        assert "createClient(" in source
+        assert "createClientModal" in source
+        assert "newClientName" in source
 
-    def test_admin_ui_strategy_crud(self):
+    def test_admin_ui_strategy_crud(self, ui_get):
         """Test strategy CRUD interface."""
-        response = client.get("/admin/ui")
-        assert "createStrategy(" in response.text
-        assert "createStrategyModal" in response.text
-        assert "newStrategyId" in response.text
+        source = get_admin_ui_source(ui_get)
+        assert "createStrategy(" in source
+        assert "createStrategyModal" in source
+        assert "newStrategyId" in source
 
-    def test_admin_ui_role_management(self):
+    def test_admin_ui_role_management(self, ui_get):
         """Test role management interface."""
-        response = client.get("/admin/ui")
-        assert "assignRoleToClient" in response.text
-        assert "createRole" in response.text
-        assert "newRoleCode" in response.text
+        source = get_admin_ui_source(ui_get)
+        assert "assignRoleToClient" in source
+        assert "createRole" in source
+        assert "newRoleCode" in source
 
-    def test_admin_ui_permission_management(self):
+    def test_admin_ui_permission_management(self, ui_get):
         """Test permission management interface."""
-        response = client.get("/admin/ui")
-        assert "createPermission" in response.text
-        assert "createPermModal" in response.text
-        assert "newPermCode" in response.text
+        source = get_admin_ui_source(ui_get)
+        assert "createPermission" in source
+        assert "createPermModal" in source
+        assert "newPermCode" in source
 
-    def test_admin_ui_has_all_modals(self):
+    def test_admin_ui_has_all_modals(self, ui_get):
         """Test that all CRUD modals exist."""
-        response = client.get("/admin/ui")
+        source = get_admin_ui_source(ui_get)
         modals = [
             "createUserModal",
             "createClientModal",
@@ -87,16 +102,15 @@ class TestAdminUICRUD:
             "createRoleModal",
             "createPermModal"
         ]
-        for modal in modals:
-            assert modal in response.text
+        assert_all_in(source, modals)
 
 
 class TestAdminUIFunctions:
     """Test JavaScript functions in Admin UI."""
 
-    def test_crud_functions_exist(self):
+    def test_crud_functions_exist(self, ui_get):
         """Test that all CRUD JavaScript functions exist."""
-        response = client.get("/admin/ui")
+        source = get_admin_ui_source(ui_get)
         functions = [
             "loadUsers()",
             "showCreateUser()",
@@ -111,12 +125,11 @@ class TestAdminUIFunctions:
             "createPermission()",
             "assignRoleToClient()"
         ]
-        for func in functions:
-            assert func in response.text
+        assert_all_in(source, functions)
 
-    def test_hide_functions_exist(self):
+    def test_hide_functions_exist(self, ui_get):
         """Test that hide modal functions exist."""
-        response = client.get("/admin/ui")
+        source = get_admin_ui_source(ui_get)
         hide_functions = [
             "hideCreateUser()",
             "hideCreateClient()",
@@ -124,5 +137,4 @@ class TestAdminUIFunctions:
             "hideCreateRole()",
             "hideCreatePermission()"
         ]
-        for func in hide_functions:
-            assert func in response.text
+        assert_all_in(source, hide_functions)
@@ -1,22 +1,102 @@
 """
 Tests for admin UI routes.
 """
-from fastapi.testclient import TestClient
-
 from src.main import app
+from src.web.admin_ui import _minify_source
 
 
-def test_admin_ui_home():
+def test_admin_ui_home(ui_client):
     """Admin UI home returns HTML."""
-    client = TestClient(app)
-    response = client.get("/admin/ui")
+    response = ui_client.get("/admin/ui")
     assert response.status_code == 200
     assert "Signal Transceiver Admin" in response.text
 
 
-def test_admin_ui_health():
+def test_admin_ui_home_gzip(ui_client):
+    """Admin UI home serves the precompressed page to gzip clients."""
+    response = ui_client.get("/admin/ui", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Signal Transceiver Admin" in response.text
+
+
+def test_admin_ui_assets_are_immutable(ui_client):
+    """Admin UI stylesheet is served from a hashed, immutable URL."""
+    page = ui_client.get("/admin/ui").text
+    css_url = page.split('<link rel="stylesheet" href="')[1].split('"')[0]
+    response = ui_client.get(css_url)
+    assert response.status_code == 200
+    assert "immutable" in response.headers["cache-control"]
+    assert ui_client.get("/admin/ui/assets/missing.css").status_code == 404
+
+
+def test_admin_ui_home_not_modified(ui_client):
+    """Admin UI home returns 304 when the ETag matches."""
+    etag = ui_client.get("/admin/ui").headers["etag"]
+    response = ui_client.get("/admin/ui", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_admin_ui_home_etag_per_encoding(ui_client):
+    """Gzip and identity pages carry distinct ETags and each revalidates."""
+    plain = ui_client.get("/admin/ui", headers={"Accept-Encoding": "identity"})
+    gzipped = ui_client.get("/admin/ui", headers={"Accept-Encoding": "gzip"})
+    assert plain.headers["etag"] != gzipped.headers["etag"]
+    for etag in (plain.headers["etag"], gzipped.headers["etag"]):
+        response = ui_client.get("/admin/ui", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+
+def test_admin_ui_health(ui_client):
     """Admin UI health endpoint works."""
-    client = TestClient(app)
-    response = client.get("/admin/ui/health")
+    response = ui_client.get("/admin/ui/health")
     assert response.status_code == 200
     assert "Admin UI" in response.text
+
+
+def test_admin_ui_health_not_modified(ui_client):
+    """Admin UI health page is prebuilt and revalidates with its ETag."""
+    first = ui_client.get("/admin/ui/health")
+    second = ui_client.get("/admin/ui/health")
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+    response = ui_client.get("/admin/ui/health", headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 304
+
+
+def test_admin_ui_head(ui_client):
+    """HEAD on the admin UI returns headers only, with the GET body length."""
+    page = ui_client.get("/admin/ui", headers={"Accept-Encoding": "identity"})
+    response = ui_client.head("/admin/ui", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["etag"] == page.headers["etag"]
+    assert response.headers["content-length"] == str(len(page.content))
+    assert ui_client.head("/admin/ui/health").status_code == 200
+
+
+def test_admin_ui_home_is_minified_utf8(ui_client):
+    """Admin UI page is minified at import and carries real UTF-8 emoji."""
+    page = ui_client.get("/admin/ui").text
+    assert "🚀" in page
+    assert "ğŸ" not in page
+    assert "<!--" not in page
+    assert not any(line.startswith(" ") for line in page.splitlines())
+
+
+def test_minify_source_keeps_pre_and_template_literals():
+    """Whitespace inside <pre> and JS template literals survives minification."""
+    source = "  <div>\n  <pre>a\n    b</pre>\n  const s = `x\n    y`;\n  // note\n"
+    assert _minify_source(source) == "<div>\n<pre>a\n    b</pre>\nconst s = `x\n    y`;"
+
+
+def test_admin_ui_routes_are_unique():
+    """Each admin UI path/method pair is registered exactly once."""
+    for path in ("/admin/ui", "/admin/ui/health"):
+        for method in ("GET", "HEAD"):
+            routes = [
+                r for r in app.routes
+                if getattr(r, "path", None) == path and method in getattr(r, "methods", ())
+            ]
+            assert len(routes) == 1, f"{method} {path}"
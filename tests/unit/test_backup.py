@@ -2,9 +2,8 @@
 Tests for backup service.
 """
 import pytest
+import pytest_asyncio
 import os
-import tempfile
-import shutil
 from datetime import datetime
 from pathlib import Path
 
@@ -15,11 +14,10 @@ class TestBackupService:
     """Tests for backup service."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory."""
-        temp = tempfile.mkdtemp()
-        yield temp
-        shutil.rmtree(temp, ignore_errors=True)
+    def temp_dir(self, fs):
+        """Create a working directory on pyfakefs' in-memory filesystem."""
+        fs.create_dir("/work")
+        return "/work"
 
     @pytest.fixture
     def test_db(self, temp_dir):
@@ -38,6 +36,11 @@ class TestBackupService:
             max_backups=5
         )
 
+    @pytest_asyncio.fixture
+    async def compressed_backup(self, backup_service, test_db):
+        """Create one gzip-compressed backup of the test database."""
+        return await backup_service.create_backup(test_db, compress=True)
+
     @pytest.mark.asyncio
     async def test_create_backup(self, backup_service, test_db):
         """Test creating a backup."""
@@ -50,12 +53,10 @@ class TestBackupService:
         assert os.path.exists(backup.filepath)
 
     @pytest.mark.asyncio
-    async def test_create_backup_compressed(self, backup_service, test_db):
+    async def test_create_backup_compressed(self, compressed_backup):
         """Test creating a compressed backup."""
-        backup = await backup_service.create_backup(test_db, compress=True)
-
-        assert backup.filename.endswith(".gz")
-        assert backup.compressed is True
+        assert compressed_backup.filename.endswith(".gz")
+        assert compressed_backup.compressed is True
 
     @pytest.mark.asyncio
     async def test_list_backups(self, backup_service, test_db):
@@ -104,12 +105,10 @@ class TestBackupService:
         assert restore_path.read_text() == "test database content"
 
     @pytest.mark.asyncio
-    async def test_restore_compressed_backup(self, backup_service, test_db, temp_dir):
+    async def test_restore_compressed_backup(self, backup_service, compressed_backup, temp_dir):
         """Test restoring a compressed backup."""
-        backup = await backup_service.create_backup(test_db, compress=True)
-
         restore_path = Path(temp_dir) / "restored.db"
-        await backup_service.restore_backup(backup.filename, str(restore_path))
+        await backup_service.restore_backup(compressed_backup.filename, str(restore_path))
 
         assert restore_path.exists()
 
@@ -5,7 +5,20 @@ import pytest
 from datetime import datetime, timedelta
 
 from src.core.config_manager import ConfigManager, ConfigType
-from src.services.log_search_service import LogSearchService, LogLevel, LogSearchQuery
+from src.services.log_search_service import (
+    LogSearchService, LogLevel, LogSearchQuery, LogEntry
+)
+
+
+def seed_logs(service: LogSearchService, count: int, level: LogLevel = LogLevel.INFO):
+    """Append count "Message {i}" entries in one batch, bypassing add()."""
+    base = service._counter
+    now = datetime.utcnow()
+    service._logs.extend(
+        LogEntry(id=f"LOG-{base + i + 1:010d}", timestamp=now, level=level, message=f"Message {i}")
+        for i in range(count)
+    )
+    service._counter = base + count
 
 
 class TestConfigManager:
@@ -179,8 +192,7 @@ class TestLogSearchService:
 
     def test_search_pagination(self, service):
         """Test search pagination."""
-        for i in range(20):
-            service.add(LogLevel.INFO, f"Message {i}")
+        seed_logs(service, 20)
 
         query = LogSearchQuery(limit=5, offset=0)
         results = service.search(query)
@@ -124,3 +124,65 @@ class TestExceptionInheritance:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestPrettyJSONMiddleware:
+    """Tests for the ?pretty=1 JSON middleware."""
+
+    def _client(self):
+        from src.core.middleware import PrettyJSONMiddleware
+
+        app = FastAPI()
+        app.add_middleware(PrettyJSONMiddleware)
+
+        @app.get("/item")
+        async def item():
+            return {"id": 1, "name": "test"}
+
+        return TestClient(app)
+
+    def test_compact_by_default(self):
+        """Test JSON is left untouched without the pretty flag."""
+        response = self._client().get("/item")
+
+        assert response.text == '{"id":1,"name":"test"}'
+
+    def test_pretty_flag_indents(self):
+        """Test ?pretty=1 returns indented JSON."""
+        response = self._client().get("/item?pretty=1")
+
+        assert response.text == '{\n  "id": 1,\n  "name": "test"\n}'
+        assert response.json() == {"id": 1, "name": "test"}
+
+
+class TestSelectiveGZipMiddleware:
+    """Tests for gzip compression with excluded paths."""
+
+    def _client(self):
+        from src.core.middleware import SelectiveGZipMiddleware
+
+        app = FastAPI()
+        app.add_middleware(SelectiveGZipMiddleware, minimum_size=10, exclude_paths=["/stream"])
+
+        @app.get("/item")
+        async def item():
+            return {"payload": "x" * 100}
+
+        @app.get("/stream")
+        async def stream():
+            return {"payload": "x" * 100}
+
+        return TestClient(app)
+
+    def test_compresses_other_paths(self):
+        """Test regular responses are still gzipped."""
+        response = self._client().get("/item", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+
+    def test_skips_excluded_paths(self):
+        """Test excluded paths are sent uncompressed."""
+        response = self._client().get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"payload": "x" * 100}
@@ -1,59 +1,55 @@
 """
 Tests for Data Import Service
 """
+import csv
 import pytest
 import pytest_asyncio
-from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import StaticPool
+from datetime import date, datetime
+from io import StringIO
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.config.database import Base
+from src.services import import_service
 from src.services.import_service import DataImportService
+from src.models.data import Data
 from src.models.strategy import Strategy
 from src.models.user import User
-from src.core.security import generate_api_key, generate_client_credentials, get_password_hash
+from tests.helpers import create_test_schema, make_test_engine
 
 
 @pytest_asyncio.fixture
 async def db_session():
     """Create test database session"""
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool
-    )
+    engine = make_test_engine()
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await create_test_schema(engine)
 
     session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
     async with session_maker() as session:
         yield session
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    # The in-memory database goes away with its connection; no DDL needed
+    await engine.dispose()
 
 
 @pytest_asyncio.fixture
-async def test_user(db_session):
+async def test_user(db_session, _test_credentials):
     """Create test user"""
-    api_key, hashed_key = generate_api_key()
-    client_key, client_secret, hashed_secret = generate_client_credentials()
-
+    creds = _test_credentials["user"]
     user = User(
         username="testuser",
         email="test@example.com",
-        hashed_password=get_password_hash("password123"),
-        api_key=hashed_key,
-        client_key=client_key,
-        client_secret=hashed_secret,
+        hashed_password=_test_credentials["hashed_password"],
+        api_key=creds["hashed_key"],
+        client_key=creds["client_key"],
+        client_secret=creds["hashed_secret"],
         is_active=True,
         is_admin=False
     )
     db_session.add(user)
+    # expire_on_commit=False keeps the flushed primary key; no refresh needed
     await db_session.commit()
-    await db_session.refresh(user)
     return user
 
 
@@ -61,18 +57,36 @@ async def test_user(db_session):
 async def test_strategy(db_session, test_user):
     """Create test strategy"""
     strategy = Strategy(
+        strategy_id="import_strategy",
         name="Test Strategy",
         description="Test strategy for import",
         type="trading",
-        user_id=test_user.id,
         is_active=True
     )
     db_session.add(strategy)
     await db_session.commit()
-    await db_session.refresh(strategy)
     return strategy
 
 
+@pytest.mark.parametrize("csv_content", [
+    "type,symbol,description\nsignal,AAPL,\ndata,,Market data\n",
+    'type,symbol,description\nsignal,AAPL,"Buy, then hold"\n',
+    "type,symbol,description\n",
+], ids=["empty_cells", "quoted_commas", "header_only"])
+def test_parse_csv_rows_pyarrow_matches_csv_module(csv_content, monkeypatch):
+    """Test the pyarrow CSV path yields exactly what csv.DictReader does"""
+    pytest.importorskip("pyarrow")
+    expected = list(csv.DictReader(StringIO(csv_content)))
+
+    # Make the csv-module fallback unusable so the rows must come from pyarrow
+    def _no_fallback(*args, **kwargs):
+        raise AssertionError("fell back to csv.DictReader")
+
+    monkeypatch.setattr(import_service.csv, "DictReader", _no_fallback)
+
+    assert import_service._parse_csv_rows(csv_content) == expected
+
+
 class TestDataImportService:
     """Test data import service"""
 
@@ -92,6 +106,43 @@ data,{test_strategy.id},GOOGL,2024-01-02,Market data,"{{\\"volume\\": 1000000}}"
         assert result.failed == 0
         assert len(result.errors) == 0
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("row_count", [1, 1000])
+    async def test_import_from_csv_many_rows(self, db_session, test_user, test_strategy, row_count):
+        """Test CSV import scales to larger files"""
+        lines = ["type,strategy_id,symbol,execute_date,description,metadata"]
+        lines.extend(
+            f"signal,{test_strategy.id},SYM{i},2024-01-01,Row {i},{{}}"
+            for i in range(row_count)
+        )
+
+        service = DataImportService(db_session)
+        result = await service.import_from_csv("\n".join(lines), test_user.id)
+
+        assert result.total == row_count
+        assert result.success == row_count
+        assert result.failed == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+    async def test_import_from_csv_chunked(
+        self, db_session, test_user, test_strategy, monkeypatch, chunk_size
+    ):
+        """Test CSV rows are written correctly whatever the INSERT chunk size"""
+        monkeypatch.setattr(import_service, "IMPORT_CHUNK_SIZE", chunk_size)
+        lines = ["type,strategy_id,symbol,execute_date,description,metadata"]
+        lines.extend(
+            f"signal,{test_strategy.id},SYM{i},2024-01-01,Row {i},{{}}"
+            for i in range(5)
+        )
+
+        service = DataImportService(db_session)
+        result = await service.import_from_csv("\n".join(lines), test_user.id)
+        count = await db_session.scalar(select(func.count(Data.id)))
+
+        assert result.success == 5
+        assert count == 5
+
     @pytest.mark.asyncio
     async def test_import_from_csv_with_errors(self, db_session, test_user):
         """Test CSV import with invalid data"""
@@ -158,6 +209,53 @@ invalid,,GOOGL,2024-01-02,Invalid,{}
         assert result.total == 2
         assert result.failed == 2
 
+    @pytest.mark.asyncio
+    async def test_import_records(self, db_session, test_user, test_strategy):
+        """Test importing already-parsed records"""
+        records = [
+            {
+                "type": "signal",
+                "strategy_id": test_strategy.id,
+                "symbol": "AAPL",
+                "execute_date": date(2024, 1, 1),
+                "metadata": {"price": 150.0}
+            },
+            {
+                "type": "signal",
+                "strategy_id": 999,  # Non-existent strategy
+                "symbol": "GOOGL",
+                "execute_date": date(2024, 1, 2)
+            }
+        ]
+
+        service = DataImportService(db_session)
+        result = await service.import_records(records, test_user.id)
+
+        assert result.total == 2
+        assert result.success == 1
+        assert result.failed == 1
+        assert result.errors[0]["row"] == 2
+
+    @pytest.mark.asyncio
+    async def test_import_records_bulk(self, db_session, test_user, test_strategy):
+        """Test importing records with a single bulk INSERT"""
+        records = [
+            {
+                "type": "signal",
+                "strategy_id": test_strategy.id,
+                "symbol": symbol,
+                "execute_date": date(2024, 1, 1)
+            }
+            for symbol in ("AAPL", "GOOGL", "MSFT")
+        ]
+
+        service = DataImportService(db_session)
+        result = await service.import_records(records, test_user.id, bulk=True)
+
+        assert result.total == 3
+        assert result.success == 3
+        assert result.failed == 0
+
     @pytest.mark.asyncio
     async def test_validate_import_data(self, db_session):
         """Test data validation"""
@@ -1,5 +1,5 @@
 """
-Tests for new functionality: scheduler, cache, validation, compliance.
+Tests for new functionality: scheduler, cache, validation, compliance, alerts.
 """
 import pytest
 from datetime import datetime, date
@@ -9,6 +9,7 @@ from src.core.scheduler import Scheduler, ScheduledTask, TaskStatus
 from src.core.cache import LRUCache, CacheManager, make_cache_key
 from src.core.validation import DataValidator, ValidationLevel
 from src.core.compliance import TargetCompliance, ComplianceStatus, ComplianceCategory
+from src.monitor.alerts import AlertManager, AlertLevel
 
 
 class TestScheduler:
@@ -117,6 +118,17 @@ class TestCache:
         assert await cache.get("key1") is None
         assert await cache.get("key4") == "value4"
 
+    @pytest.mark.asyncio
+    async def test_cache_set_many(self):
+        """Test bulk set applies LRU eviction like individual sets."""
+        cache = LRUCache(max_size=3, default_ttl=300)
+
+        await cache.set_many({f"key{i}": f"value{i}" for i in range(1, 5)})
+
+        assert await cache.get("key1") is None
+        assert await cache.get("key4") == "value4"
+        assert cache.get_stats()["evictions"] == 1
+
     def test_make_cache_key(self):
         """Test cache key generation."""
         key1 = make_cache_key("arg1", "arg2", foo="bar")
@@ -256,3 +268,25 @@ class TestCompliance:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestAlertManager:
+    """Tests for alert manager lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_alerts_filters_by_level_and_state(self):
+        """Test indexed alert lookups stay consistent with resolve."""
+        manager = AlertManager()
+        warning = await manager.trigger("Disk", "Disk almost full", AlertLevel.WARNING, "test")
+        critical = await manager.trigger("CPU", "CPU pegged", AlertLevel.CRITICAL, "test")
+
+        assert warning in manager.get_alerts(level=AlertLevel.WARNING)
+        assert critical not in manager.get_alerts(level=AlertLevel.WARNING)
+
+        manager.resolve(warning.id)
+
+        assert warning.resolved is True
+        assert warning not in manager.get_active_alerts()
+        assert warning not in manager.get_alerts(level=AlertLevel.WARNING)
+        assert warning in manager.get_alerts(level=AlertLevel.WARNING, active_only=False)
+        assert critical in manager.get_alerts()
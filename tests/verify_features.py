@@ -340,7 +340,7 @@ test_files = [
     "tests/unit/test_security.py",
     "tests/unit/test_import.py",  # 新增
     "tests/integration/test_api_flow.py",
-    "comprehensive_test.py",
+    "tests/test_comprehensive.py",
 ]
 
 for test_file in test_files: